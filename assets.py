@@ -1,85 +1,277 @@
 import pygame
 import os
 import sys
+import functools
+import io
+import json
+import mmap
+import pickle
+import struct
+import tempfile
+import threading
+import zlib
 from PIL import Image, ImageSequence
 from typing import List, Tuple, Optional, Dict, Any
-from config import GRAPHICS_DIR, SOUND_DIR, FONT_DIR, SNAKE_GRAPHICS_COORDS, DEFAULT_SNAKE_COLOR, SNAKE_TILE_SIZE, SNAKE_SPRITE_SHEET, APPLE_TILE_COORDS, CELL_SIZE_DEFAULT
+from config import BASE_DIR, GRAPHICS_DIR, SOUND_DIR, FONT_DIR, CACHE_DIR, ASSET_PAK_FILE, ASSET_PAK_MAGIC, SNAKE_COLOR_INDEX, SNAKE_RECTS, DEFAULT_SNAKE_COLOR, SNAKE_TILE_SIZE, SNAKE_SPRITE_SHEET, APPLE_TILE_RECTS, APPLE_PLACEHOLDER_COLORS, CELL_SIZE_DEFAULT, LEVEL_BG_TILES
 
-pygame.mixer.pre_init(44100, -16, 2, 512) 
-pygame.init() 
+# --- Asset Path Joiners ---
+_gp = functools.partial(os.path.join, GRAPHICS_DIR)
+_sp = functools.partial(os.path.join, SOUND_DIR)
+_fp = functools.partial(os.path.join, FONT_DIR)
+
+# --- Asset Pak ---
+# When assets.pak exists it is memory-mapped once and every loader reads from it,
+# replacing many small open/read calls with slices of one mapping. A loose file edited
+# after the pak was built takes precedence over its packed copy, so a stale pak never hides changes.
+_pak: Optional[mmap.mmap] = None
+_pak_index: Dict[str, Tuple[int, int]] = {}
+_pak_mtime = 0.0
+_pak_checked = False
+
+def _load_pak():
+    global _pak, _pak_index, _pak_mtime, _pak_checked
+    _pak_checked = True
+    if not os.path.isfile(ASSET_PAK_FILE):
+        return
+    try:
+        with open(ASSET_PAK_FILE, "rb") as f:
+            pak = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            pak_mtime = os.fstat(f.fileno()).st_mtime
+        footer_size = 8 + len(ASSET_PAK_MAGIC)
+        if pak[-len(ASSET_PAK_MAGIC):] != ASSET_PAK_MAGIC:
+            print(f"Warning: {ASSET_PAK_FILE} is not a valid asset pak. Loading files directly.")
+            pak.close()
+            return
+        (index_offset,) = struct.unpack("<Q", pak[-footer_size:-len(ASSET_PAK_MAGIC)])
+        index = json.loads(pak[index_offset:-footer_size].decode("utf-8"))
+        _pak_index = {name: (offset, length) for name, (offset, length) in index.items()}
+        _pak_mtime = pak_mtime
+        _pak = pak
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Warning: Could not read asset pak {ASSET_PAK_FILE}: {e}")
+
+def _asset_source(path: str) -> Tuple[Optional[Tuple[int, int]], Optional[float]]:
+    """Where open_asset reads path from: the pak entry (None for the loose file) and that source's mtime.
+    The mtime is None when the asset exists nowhere."""
+    if not _pak_checked:
+        _load_pak()
+    try:
+        loose_mtime: Optional[float] = os.path.getmtime(path)
+    except OSError:
+        loose_mtime = None
+    if _pak is not None:
+        entry = _pak_index.get(os.path.relpath(path, BASE_DIR).replace(os.sep, "/"))
+        if entry is not None and (loose_mtime is None or loose_mtime <= _pak_mtime):
+            return entry, _pak_mtime
+    return None, loose_mtime
+
+def asset_mtime(path: str) -> Optional[float]:
+    """Modification time of the bytes open_asset serves for path (the pak's if packed), or None if missing.
+    Disk caches derived from an asset compare against this, not the loose file's mtime."""
+    return _asset_source(path)[1]
+
+def open_asset(path: str):
+    """Returns a BytesIO over the asset's bytes in the pak, or the path itself if the loose file is used."""
+    entry, _ = _asset_source(path)
+    if entry is None:
+        return path
+    offset, length = entry
+    return io.BytesIO(_pak[offset:offset + length])
 
 # --- Asset Loading Cache ---
-_image_cache = {}
 _font_cache = {}
 _sound_cache = {}
+# Sound loading runs on both the prefetch thread and the main thread; this serializes it
+_sound_lock = threading.RLock()
 _tileset_cache = {}
-_snake_sprite_sheet_cache = {}
+_snake_rects_cache = {}
+_apple_sprites_cache = {}
+_level_bg_cache: Dict[Tuple[int, int, int], Optional[pygame.Surface]] = {}
+_scaled_apple_sprites_cache: Dict[Tuple[int, Tuple[int, int]], Tuple[pygame.Surface, ...]] = {}
+_placeholder_cache: Dict[Tuple[Any, int], pygame.Surface] = {}
+_raw_image_cache: Dict[str, pygame.Surface] = {}
+# The prefetch thread and the main thread may both ask for a sheet; this keeps it to one decode
+_raw_image_lock = threading.Lock()
+_gif_cache: Dict[Tuple[str, Tuple[int, int], bool], List[pygame.Surface]] = {}
 
 # Default volume setting
 DEFAULT_VOLUME = 0.7
 
+# The mixer is only opened once a sound or music track is actually needed
+_mixer_initialized = False
+
+def _ensure_mixer():
+    """Initializes pygame.mixer on first use instead of at import time."""
+    global _mixer_initialized
+    if _mixer_initialized:
+        return
+    if not pygame.mixer.get_init():
+        pygame.mixer.pre_init(44100, -16, 2, 512)
+        pygame.mixer.init()
+    _mixer_initialized = True
+
+# Shared fallback for sounds that fail to load, built once the mixer is open
+_silent_sound: Optional[pygame.mixer.Sound] = None
+
+def _get_silent_sound() -> pygame.mixer.Sound:
+    global _silent_sound
+    if _silent_sound is None:
+        _silent_sound = pygame.mixer.Sound(buffer=bytes(44))
+    return _silent_sound
+
+def _pcm_cache_path(filename: str) -> str:
+    """Raw PCM depends on the mixer format, so it is part of the cache file name."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return os.path.join(CACHE_DIR, f"{filename}_{frequency}_{size}_{channels}.raw")
+
+
+def _read_pcm_cache(filename: str) -> Optional[pygame.mixer.Sound]:
+    """Builds the sound from PCM decoded by an earlier run if it is newer than the source file."""
+    # Compared against the bytes open_asset decodes, which may be the pak rather than the loose file
+    source_mtime = asset_mtime(_sp(filename))
+    if source_mtime is None:
+        return None
+    cache_path = _pcm_cache_path(filename)
+    try:
+        if os.path.getmtime(cache_path) < source_mtime:
+            return None
+        with open(cache_path, "rb") as f:
+            return pygame.mixer.Sound(buffer=f.read())
+    except (OSError, pygame.error):
+        return None
+
+
+def _write_pcm_cache(filename: str, sound: pygame.mixer.Sound):
+    cache_path = _pcm_cache_path(filename)
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # A unique temp file, so two writers can never interleave into the same partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".raw.tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(sound.get_raw())
+        os.replace(tmp_path, cache_path)
+    except (OSError, pygame.error) as e:
+        print(f"Warning: could not write sound cache for {filename}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def load_sound(filename: str) -> pygame.mixer.Sound:
-    """Loads a sound file. Uses caching."""
+    """Loads a sound file. Uses caching, including a raw PCM cache on disk. Thread-safe."""
+    with _sound_lock:
+        return _load_sound_locked(filename)
+
+def _load_sound_locked(filename: str) -> pygame.mixer.Sound:
     if filename in _sound_cache:
         return _sound_cache[filename]
+    _ensure_mixer()
+    sound = _read_pcm_cache(filename)
+    if sound is not None:
+        _sound_cache[filename] = sound
+        return sound
     try:
-        sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, filename))
+        sound = pygame.mixer.Sound(file=open_asset(_sp(filename)))
+        _write_pcm_cache(filename, sound)
         _sound_cache[filename] = sound
         return sound
-    except pygame.error as e:
+    except (pygame.error, FileNotFoundError) as e:
         print(f"Error loading sound {filename}: {e}")
-        # Create a silent sound as a fallback
-        buffer = pygame.sndarray.array(pygame.Surface((1, 1)))
-        silent_sound = pygame.sndarray.make_sound(buffer)
-        _sound_cache[filename] = silent_sound
-        return silent_sound
-    except FileNotFoundError:
-        print(f"Error: Sound file not found: {filename}")
-        # Create a silent sound as a fallback
-        buffer = pygame.sndarray.array(pygame.Surface((1, 1)))
-        silent_sound = pygame.sndarray.make_sound(buffer)
-        _sound_cache[filename] = silent_sound
-        return silent_sound
+        _sound_cache[filename] = _get_silent_sound()
+        return _sound_cache[filename]
+
+class _Sounds:
+    """Loaded sound effects, one slot per SoundManager.SOUND_FILES entry (None until first played)."""
+    __slots__ = ("crunch", "vomit", "game_over", "game_start", "level_finished", "menu_button")
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+
 
 # Sound Manager for controlling all game sounds
 class SoundManager:
+    # Sound effects are decoded the first time they are played
+    SOUND_FILES = {
+        "crunch": "crunch.wav",
+        "vomit": "vomit.mp3",
+        "game_over": "game-over.wav",
+        "game_start": "game-start.mp3",
+        "level_finished": "level-finished.wav",
+        "menu_button": "menu-button.mp3",
+    }
+
     def __init__(self):
         self.volume = DEFAULT_VOLUME
         self.music_loaded = False
-        self.sounds = {}
+        self.s = _Sounds()
         self.music_paused = False
-        
-        self.load_common_sounds()
-        
-    def load_common_sounds(self):
-        
-        self.sounds["crunch"] = load_sound("crunch.wav")
-        self.sounds["vomit"] = load_sound("vomit.mp3")
-        self.sounds["game_over"] = load_sound("game-over.wav")
-        self.sounds["game_start"] = load_sound("game-start.mp3")
-        self.sounds["level_finished"] = load_sound("level-finished.wav")
-        self.sounds["menu_button"] = load_sound("menu-button.mp3")
-        
-        self.set_volume(self.volume)
+        self._dispatch = {
+            "crunch": self.play_crunch,
+            "vomit": self.play_vomit,
+            "game_over": self.play_game_over,
+            "game_start": self.play_game_start,
+            "level_finished": self.play_level_finished,
+            "menu_button": self.play_menu_button,
+        }
+
+    def _ensure_loaded(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Loads a sound on first request and applies the current volume to it."""
+        if sound_name not in self.SOUND_FILES:
+            return None
+        sound = getattr(self.s, sound_name)
+        if sound is None:
+            # Also called by the prefetch thread; the lock keeps the slots and volumes consistent
+            with _sound_lock:
+                sound = getattr(self.s, sound_name)
+                if sound is None:
+                    sound = load_sound(self.SOUND_FILES[sound_name])
+                    sound.set_volume(self.volume)
+                    setattr(self.s, sound_name, sound)
+        return sound
     
     def set_volume(self, volume: float):
         """Set volume for all sound effects (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
         
-        pygame.mixer.music.set_volume(self.volume)
+        if _mixer_initialized:
+            pygame.mixer.music.set_volume(self.volume)
         
-        for sound in self.sounds.values():
-            sound.set_volume(self.volume)
+        with _sound_lock:
+            for sound_name in _Sounds.__slots__:
+                sound = getattr(self.s, sound_name)
+                if sound is not None:
+                    sound.set_volume(self.volume)
     
+    def play_crunch(self):
+        (self.s.crunch or self._ensure_loaded("crunch")).play()
+
+    def play_vomit(self):
+        (self.s.vomit or self._ensure_loaded("vomit")).play()
+
+    def play_game_over(self):
+        (self.s.game_over or self._ensure_loaded("game_over")).play()
+
+    def play_game_start(self):
+        (self.s.game_start or self._ensure_loaded("game_start")).play()
+
+    def play_level_finished(self):
+        (self.s.level_finished or self._ensure_loaded("level_finished")).play()
+
+    def play_menu_button(self):
+        (self.s.menu_button or self._ensure_loaded("menu_button")).play()
+
     def play_sound(self, sound_name: str):
-        """Play a sound by name"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        """Play a sound by name (compatibility shim over the play_<name> methods)"""
+        play = self._dispatch.get(sound_name)
+        if play:
+            play()
     
     def play_music(self, filename: str = "bg-music.mp3", loop: bool = True):
         """Start playing background music"""
         try:
-            music_path = os.path.join(SOUND_DIR, filename)
+            _ensure_mixer()
+            music_path = _sp(filename)
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(self.volume)
             if loop:
@@ -93,7 +285,8 @@ class SoundManager:
     
     def stop_music(self):
         """Stop background music"""
-        pygame.mixer.music.stop()
+        if _mixer_initialized:
+            pygame.mixer.music.stop()
     
     def pause_music(self):
         """Pause background music"""
@@ -109,27 +302,50 @@ class SoundManager:
     
     def fade_out_music(self, time_ms: int = 1000):
         """Fade out music over time_ms milliseconds"""
-        pygame.mixer.music.fadeout(time_ms)
+        if _mixer_initialized:
+            pygame.mixer.music.fadeout(time_ms)
+
+# Global sound manager instance, created on first request
+_sound_manager: Optional[SoundManager] = None
+
+def get_sound_manager() -> SoundManager:
+    """Returns the shared SoundManager, constructing it on demand."""
+    global _sound_manager
+    if _sound_manager is None:
+        _sound_manager = SoundManager()
+    return _sound_manager
 
-# Global sound manager instance
-sound_manager = SoundManager()
+def _load_raw_image(filename: str) -> pygame.Surface:
+    """Decodes an image without converting it to the display format. Uses caching.
+    Safe to call from the prefetch thread; callers convert on the main thread."""
+    image = _raw_image_cache.get(filename)
+    if image is None:
+        with _raw_image_lock:
+            image = _raw_image_cache.get(filename)
+            if image is None:
+                image = pygame.image.load(open_asset(_gp(filename)), filename)
+                _raw_image_cache[filename] = image
+    return image
+
+def _convert_for_display(image: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Converts to the display pixel format, keeping per-pixel alpha only if the image has transparency."""
+    if alpha and (image.get_flags() & pygame.SRCALPHA or image.get_colorkey() is not None):
+        return image.convert_alpha()
+    return image.convert()
 
 def load_image(filename: str, alpha: bool = True, scale: Optional[Tuple[int, int]] = None) -> pygame.Surface:
     """Loads an image, optionally converts alpha and scales. Uses caching."""
-    cache_key = (filename, alpha, scale)
-    if cache_key in _image_cache:
-        return _image_cache[cache_key]
+    # Normalized positional call so equivalent requests share one lru_cache entry
+    return _load_image_cached(filename, bool(alpha), tuple(scale) if scale else None)
 
+@functools.lru_cache(maxsize=256)
+def _load_image_cached(filename: str, alpha: bool, scale: Optional[Tuple[int, int]]) -> pygame.Surface:
     try:
-        image = pygame.image.load(os.path.join(GRAPHICS_DIR, filename))
-        if alpha:
-            image = image.convert_alpha()
-        else:
-            image = image.convert()
+        image = _load_raw_image(filename)
         if scale:
             image = pygame.transform.scale(image, scale)
-        _image_cache[cache_key] = image
-        return image
+        # Convert last: scaling builds a new surface, which would discard an earlier conversion
+        return _convert_for_display(image, alpha)
     except pygame.error as e:
         print(f"Error loading image {filename}: {e}")
         sys.exit()
@@ -138,16 +354,131 @@ def load_image(filename: str, alpha: bool = True, scale: Optional[Tuple[int, int
         placeholder = pygame.Surface(scale if scale else (CELL_SIZE_DEFAULT, CELL_SIZE_DEFAULT))
         placeholder.fill((255,0,0)) 
         if scale: placeholder = pygame.transform.scale(placeholder, scale)
-        _image_cache[cache_key] = placeholder 
         return placeholder 
 
-def load_font(filename: str, size: int) -> pygame.font.Font:
-    """Loads a font file. Uses caching."""
+GLYPH_FIRST, GLYPH_LAST = 32, 126
+# Every atlas glyph in one string; CachedFont checks its composed text against font.render with it
+GLYPH_PROBE = "".join(chr(code) for code in range(GLYPH_FIRST, GLYPH_LAST + 1))
+TEXT_CACHE_LIMIT = 256 # Rendered strings kept per font before the cache is cleared
+
+
+def _color_key(color) -> Any:
+    """Hashable form of a color argument (pygame.Color itself is not hashable)."""
+    if color is None or isinstance(color, str):
+        return color
+    return tuple(color)
+
+
+# pygame.image.tobytes is 2.1.3+; older versions only have tostring
+_image_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+def _same_pixels(a: pygame.Surface, b: pygame.Surface) -> bool:
+    return a.get_size() == b.get_size() and _image_to_bytes(a, "RGBA") == _image_to_bytes(b, "RGBA")
+
+
+class CachedFont:
+    """Wraps a pygame font and renders printable ASCII from per-color glyph atlases."""
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        # (sheet, glyph rects, exact) per (antialias, color); exact says composing matches font.render
+        self._atlases: Dict[Tuple[bool, Tuple[int, ...]], Tuple[pygame.Surface, Dict[str, pygame.Rect], bool]] = {}
+        # Horizontal advance of each glyph, from the font's own metrics
+        self._advances: Dict[str, int] = {}
+        # Finished text surfaces keyed by (text, antialias, color, background); callers only blit them
+        self._text_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.font, name)
+
+    def _get_atlas(self, antialias: bool, color) -> Tuple[pygame.Surface, Dict[str, pygame.Rect], bool]:
+        key = (bool(antialias), tuple(pygame.Color(color)))
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            return atlas
+        glyphs = [(chr(code), self.font.render(chr(code), antialias, color).convert_alpha())
+                  for code in range(GLYPH_FIRST, GLYPH_LAST + 1)]
+        width = sum(glyph.get_width() for _, glyph in glyphs)
+        height = max(glyph.get_height() for _, glyph in glyphs)
+        sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+        rects = {}
+        x = 0
+        for char, glyph in glyphs:
+            # BLEND_RGBA_MAX copies the glyph's alpha as-is onto the clear sheet
+            sheet.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            rects[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+        if not self._advances:
+            metrics = self.font.metrics(GLYPH_PROBE)
+            self._advances = {char: m[4] if m else rects[char].width for char, m in zip(GLYPH_PROBE, metrics)}
+        # Kerning, sub-pixel placement or glyphs overhanging their advance make composed text differ
+        # from font.render at some sizes; such atlases are never used, so text always looks the same
+        exact = (all(rects[char].width <= self._advances[char] for char in GLYPH_PROBE) and
+                 _same_pixels(self._compose(sheet, rects, GLYPH_PROBE),
+                              self.font.render(GLYPH_PROBE, antialias, color).convert_alpha()))
+        atlas = (sheet, rects, exact)
+        self._atlases[key] = atlas
+        return atlas
+
+    def _compose(self, sheet: pygame.Surface, rects: Dict[str, pygame.Rect], text: str) -> pygame.Surface:
+        """Builds text from atlas glyphs, each placed at the font's advance, on a font.size() surface."""
+        surface = pygame.Surface(self.font.size(text), pygame.SRCALPHA)
+        advances = self._advances
+        blit_sequence = []
+        x = 0
+        for char in text:
+            blit_sequence.append((sheet, (x, 0), rects[char], pygame.BLEND_RGBA_MAX))
+            x += advances[char]
+        surface.blits(blit_sequence, doreturn=False)
+        return surface
+
+    def render(self, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        """Returns the cached surface for this text, rendering it on a miss."""
+        key = (text, bool(antialias), _color_key(color), _color_key(background))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = self._render_uncached(text, antialias, color, background)
+            self._text_cache[key] = surface
+        return surface
+
+    def blit_text(self, dest: pygame.Surface, text: str, pos: Tuple[int, int], antialias: bool, color):
+        """Blits text onto dest straight from the glyph atlas, without building a text surface."""
+        if not text or not all(GLYPH_FIRST <= ord(c) <= GLYPH_LAST for c in text):
+            dest.blit(self.render(text, antialias, color), pos)
+            return
+        sheet, rects, exact = self._get_atlas(antialias, color)
+        if not exact:
+            dest.blit(self.render(text, antialias, color), pos)
+            return
+        # Exact atlases have no overlapping glyphs, so blitting them one by one equals one text blit
+        advances = self._advances
+        x, y = pos
+        blit_sequence = []
+        for char in text:
+            blit_sequence.append((sheet, (x, y), rects[char]))
+            x += advances[char]
+        dest.blits(blit_sequence, doreturn=False)
+
+    def _render_uncached(self, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        """Composes text from atlas glyphs; falls back to the font for anything else."""
+        if background is not None or not text or not all(GLYPH_FIRST <= ord(c) <= GLYPH_LAST for c in text):
+            return self.font.render(text, antialias, color, background)
+        sheet, rects, exact = self._get_atlas(antialias, color)
+        if not exact:
+            return self.font.render(text, antialias, color)
+        return self._compose(sheet, rects, text)
+
+
+def load_font(filename: str, size: int) -> CachedFont:
+    """Loads a font file wrapped in a glyph-atlas CachedFont. Uses caching."""
     cache_key = (filename, size)
     if cache_key in _font_cache:
         return _font_cache[cache_key]
     try:
-        font = pygame.font.Font(os.path.join(FONT_DIR, filename), size)
+        font = CachedFont(pygame.font.Font(open_asset(_fp(filename)), size))
         _font_cache[cache_key] = font
         return font
     except pygame.error as e:
@@ -156,31 +487,86 @@ def load_font(filename: str, size: int) -> pygame.font.Font:
     except FileNotFoundError:
         print(f"Error: Font file not found: {filename}")
         # Fallback to default pygame font
-        font = pygame.font.SysFont(pygame.font.get_default_font(), size)
+        font = CachedFont(pygame.font.SysFont(pygame.font.get_default_font(), size))
         _font_cache[cache_key] = font
         return font
 
 
-def load_gif_frames(filename: str, scale: Tuple[int, int]) -> List[pygame.Surface]:
-    """Loads frames from a GIF, scales them, and converts to Pygame surfaces."""
+def _gif_disk_cache_path(filename: str) -> Optional[str]:
+    """Path of the on-disk frame cache; the source mtime in the name invalidates stale entries.
+    None when the GIF exists in neither the pak nor the assets folder, so there is nothing to cache."""
+    # Keyed on the bytes _decode_gif reads, which may be the pak entry rather than a loose file
+    mtime = asset_mtime(_gp(filename))
+    if mtime is None:
+        return None
+    return os.path.join(CACHE_DIR, f"{filename}_{int(mtime)}.pkl")
+
+
+def _read_gif_disk_cache(cache_path: str) -> Optional[Tuple[Tuple[int, int], List[bytes]]]:
+    """Returns (size, raw RGBA frames) from the disk cache, or None on a miss."""
+    try:
+        with open(cache_path, "rb") as f:
+            data = pickle.load(f)
+        return data["size"], [zlib.decompress(frame) for frame in data["frames"]]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError, zlib.error):
+        return None
+
+
+def _write_gif_disk_cache(cache_path: str, size: Tuple[int, int], raw_frames: List[bytes]):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"size": size, "frames": [zlib.compress(frame, 1) for frame in raw_frames]},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write GIF cache {cache_path}: {e}")
+
+
+def _decode_gif(filename: str) -> Tuple[Tuple[int, int], List[bytes]]:
+    """Decodes every GIF frame to raw RGBA bytes at the source resolution."""
+    with Image.open(open_asset(_gp(filename))) as img:
+        raw_frames = []
+        for frame in ImageSequence.Iterator(img):
+            # Newer Pillow versions already hand back RGBA frames; skip the extra copy then
+            frame_rgba = frame if frame.mode == "RGBA" else frame.convert("RGBA")
+            raw_frames.append(frame_rgba.tobytes())
+        return img.size, raw_frames
+
+
+def load_gif_frames(filename: str, scale: Tuple[int, int], alpha: bool = False) -> List[pygame.Surface]:
+    """Loads frames from a GIF, scales them, and converts to Pygame surfaces. Uses caching in memory and on disk.
+    Frames are converted opaque unless alpha is set, since they are used as full-screen backgrounds."""
+    cache_key = (filename, tuple(scale), alpha)
+    if cache_key in _gif_cache:
+        return _gif_cache[cache_key]
     try:
-        with Image.open(os.path.join(GRAPHICS_DIR, filename)) as img:
-            frames = []
-            for frame in ImageSequence.Iterator(img):
-                frame_rgba = frame.convert("RGBA")
-                pygame_frame = pygame.image.fromstring(
-                    frame_rgba.tobytes(), frame_rgba.size, "RGBA"
-                ).convert_alpha()
-                scaled_frame = pygame.transform.scale(pygame_frame, scale)
-                frames.append(scaled_frame)
-            if not frames: 
-                 placeholder = pygame.Surface(scale)
-                 placeholder.fill((50,50,50))
-                 frames.append(placeholder)
-            return frames
+        cache_path = _gif_disk_cache_path(filename)
+        cached = _read_gif_disk_cache(cache_path) if cache_path else None
+        if cached:
+            size, raw_frames = cached
+        else:
+            size, raw_frames = _decode_gif(filename)
+            if raw_frames and cache_path:
+                _write_gif_disk_cache(cache_path, size, raw_frames)
+
+        frames = []
+        for raw_frame in raw_frames:
+            # frombuffer wraps the bytes without copying; convert only after scaling,
+            # since transform.scale produces a new surface anyway
+            pygame_frame = pygame.image.frombuffer(raw_frame, size, "RGBA")
+            scaled_frame = _convert_for_display(pygame.transform.scale(pygame_frame, scale), alpha)
+            frames.append(scaled_frame)
+        if not frames: 
+             placeholder = pygame.Surface(scale).convert()
+             placeholder.fill((50,50,50))
+             frames.append(placeholder)
+        _gif_cache[cache_key] = frames
+        return frames
     except FileNotFoundError:
         print(f"Error: GIF file not found: {filename}")
-        placeholder = pygame.Surface(scale)
+        placeholder = pygame.Surface(scale).convert()
         placeholder.fill((50,50,50))
         return [placeholder]
     except Exception as e:
@@ -193,11 +579,25 @@ class Tileset:
         self.filename = filename
         self.tile_width = tile_width
         self.tile_height = tile_height
+        self.scale_to_cell_size = scale_to_cell_size
         self.scale_to_size = (scale_to_cell_size, scale_to_cell_size)
         self._cache = {}
+        # Returned for every out-of-bounds lookup instead of allocating a new surface each time
+        self._oob_placeholder = pygame.Surface(self.scale_to_size)
+        self._oob_placeholder.fill((255,0,255))
+
+        cache_path = os.path.join(CACHE_DIR, f"{filename}_{tile_width}x{tile_height}_{scale_to_cell_size}.png")
+        cached_sheet = self._load_cached_sheet(cache_path)
+        if cached_sheet is not None:
+            # Pre-scaled sheet from a previous run; no decode of the source or scaling needed
+            self.image = None
+            self.scaled_image = cached_sheet
+            self.cols = cached_sheet.get_width() // scale_to_cell_size
+            self.rows = cached_sheet.get_height() // scale_to_cell_size
+            return
 
         try:
-            self.image = pygame.image.load(os.path.join(GRAPHICS_DIR, filename)).convert_alpha()
+            self.image = _load_raw_image(filename)
         except pygame.error as e:
             print(f"Error loading tileset {filename}: {e}")
             sys.exit()
@@ -208,22 +608,47 @@ class Tileset:
         self.cols = self.image.get_width() // tile_width
         self.rows = self.image.get_height() // tile_height
 
+        # Scale the whole sheet once so every tile is a view into one surface
+        full_tiles_area = self.image.subsurface((0, 0, self.cols * tile_width, self.rows * tile_height))
+        self.scaled_image = _convert_for_display(pygame.transform.scale(
+            full_tiles_area, (self.cols * scale_to_cell_size, self.rows * scale_to_cell_size)))
+        self._save_cached_sheet(cache_path)
+
+    def _load_cached_sheet(self, cache_path: str) -> Optional[pygame.Surface]:
+        """Returns the pre-scaled sheet saved by an earlier run if it is newer than the source image."""
+        # Compared against the bytes open_asset reads, which may be the pak rather than the loose file
+        source_mtime = asset_mtime(_gp(self.filename))
+        if source_mtime is None:
+            return None
+        try:
+            if os.path.getmtime(cache_path) < source_mtime:
+                return None
+            return _convert_for_display(pygame.image.load(cache_path))
+        except (OSError, pygame.error):
+            return None
+
+    def _save_cached_sheet(self, cache_path: str):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path[:-len(".png")] + ".tmp.png"
+            pygame.image.save(self.scaled_image, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pygame.error) as e:
+            print(f"Warning: Could not write tileset cache {cache_path}: {e}")
+
     def get_tile(self, tile_x: int, tile_y: int) -> Optional[pygame.Surface]:
-        """Extracts and scales a single tile from the tileset. Uses caching."""
+        """Returns a single scaled tile as a subsurface of the pre-scaled sheet. Uses caching."""
         if not (0 <= tile_x < self.cols and 0 <= tile_y < self.rows):
             print(f"Warning: Tile coordinates ({tile_x}, {tile_y}) for {self.filename} out of bounds.")
-            placeholder = pygame.Surface(self.scale_to_size)
-            placeholder.fill( (255,0,255) ) 
-            return placeholder
+            return self._oob_placeholder
 
         cache_key = (tile_x, tile_y)
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        rect = pygame.Rect(tile_x * self.tile_width, tile_y * self.tile_height,
-                           self.tile_width, self.tile_height)
-        tile_image = self.image.subsurface(rect)
-        scaled_tile = pygame.transform.scale(tile_image, self.scale_to_size)
+        rect = pygame.Rect(tile_x * self.scale_to_cell_size, tile_y * self.scale_to_cell_size,
+                           self.scale_to_cell_size, self.scale_to_cell_size)
+        scaled_tile = self.scaled_image.subsurface(rect)
         self._cache[cache_key] = scaled_tile
         return scaled_tile
 
@@ -235,84 +660,148 @@ def get_tileset(filename: str, tile_width: int, tile_height: int, scale_to_cell_
     return _tileset_cache[cache_key]
 
 
-def load_snake_sprites(cell_size: int, snake_color: str = DEFAULT_SNAKE_COLOR) -> Dict[str, pygame.Surface]:
-    """Loads all snake part sprites from Snake.png for a given color and scales them."""
-    if SNAKE_SPRITE_SHEET not in _snake_sprite_sheet_cache:
-        try:
-            _snake_sprite_sheet_cache[SNAKE_SPRITE_SHEET] = pygame.image.load(
-                os.path.join(GRAPHICS_DIR, SNAKE_SPRITE_SHEET)).convert_alpha()
-        except pygame.error as e:
-            print(f"Fatal: Error loading snake sprite sheet {SNAKE_SPRITE_SHEET}: {e}")
-            sys.exit()
-        except FileNotFoundError:
-            print(f"Fatal: Snake sprite sheet not found: {SNAKE_SPRITE_SHEET}")
-            sys.exit()
+def load_snake_atlas(cell_size: int) -> pygame.Surface:
+    """Returns the whole Snake.png scaled so each tile is cell_size pixels.
+    Shares the pre-scaled sheet of the Snake.png Tileset used for walls."""
+    return get_tileset(SNAKE_SPRITE_SHEET, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, cell_size).scaled_image
+
+
+def _atlas_rect(rect_coords: Tuple[int, int, int, int], cell_size: int) -> pygame.Rect:
+    """Maps a tile rect on the unscaled sheet to its rect on the scaled atlas."""
+    x, y = rect_coords[0], rect_coords[1]
+    return pygame.Rect(x * cell_size // SNAKE_TILE_SIZE, y * cell_size // SNAKE_TILE_SIZE,
+                       cell_size, cell_size)
 
-    sheet = _snake_sprite_sheet_cache[SNAKE_SPRITE_SHEET]
-    sprites = {}
-    coords_dict = SNAKE_GRAPHICS_COORDS.get(snake_color)
 
-    if not coords_dict:
-        print(f"Fatal: Snake color '{snake_color}' not found in SNAKE_GRAPHICS_COORDS.")
+def load_snake_sprite_rects(cell_size: int, snake_color: str = DEFAULT_SNAKE_COLOR) -> Tuple[pygame.Surface, Tuple[pygame.Rect, ...]]:
+    """Returns the scaled atlas and the source rect of every snake part for a color, for use with Surface.blits.
+    The rects are indexed by SnakePart."""
+    cache_key = (cell_size, snake_color)
+    if cache_key in _snake_rects_cache:
+        return _snake_rects_cache[cache_key]
+
+    color_index = SNAKE_COLOR_INDEX.get(snake_color)
+    if color_index is None:
+        print(f"Fatal: Snake color '{snake_color}' not found in SNAKE_COLOR_INDEX.")
         sys.exit()
 
-    for part_name, rect_coords in coords_dict.items():
-        try:
-            sprite_image = sheet.subsurface(rect_coords)
-            sprites[part_name] = pygame.transform.scale(sprite_image, (cell_size, cell_size))
-        except ValueError as e:
-            print(f"Error creating subsurface for snake part '{part_name}' with coords {rect_coords}: {e}")
-            print(f"Ensure '{SNAKE_SPRITE_SHEET}' contains this part for color '{snake_color}' at the specified coordinates.")
-            print("Using a placeholder for this part.")
-            placeholder = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            placeholder.fill((0,0,0,0)) 
-            pygame.draw.rect(placeholder, (255,0,0), placeholder.get_rect(),1) 
-            sprites[part_name] = placeholder
-
-    standard_parts = [
-        "head_up", "head_down", "head_left", "head_right",
-        "tail_up", "tail_down", "tail_left", "tail_right",
-        "body_vertical", "body_horizontal",
-        "body_tr", "body_tl", "body_br", "body_bl"
-    ]
-    for part in standard_parts:
-        if part not in sprites:
-            print(f"Warning: Snake part '{part}' for color '{snake_color}' is missing from SNAKE_GRAPHICS_COORDS. Using placeholder.")
-            placeholder = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            placeholder.fill((0,0,0,0))
-            pygame.draw.rect(placeholder, (255,0,255), placeholder.get_rect(),1)
-            sprites[part] = placeholder
-            
-    return sprites
-
-
-def load_apple_sprites(cell_size: int) -> Dict[str, pygame.Surface]:
-    """Loads apple sprites from the Snake."""
-    if SNAKE_SPRITE_SHEET not in _snake_sprite_sheet_cache:
-        try:
-            _snake_sprite_sheet_cache[SNAKE_SPRITE_SHEET] = pygame.image.load(
-                os.path.join(GRAPHICS_DIR, SNAKE_SPRITE_SHEET)).convert_alpha()
-        except pygame.error as e:
-            print(f"Fatal: Error loading snake sprite sheet {SNAKE_SPRITE_SHEET}: {e}")
-            sys.exit()
-        except FileNotFoundError:
-            print(f"Fatal: Snake sprite sheet not found: {SNAKE_SPRITE_SHEET}")
-            sys.exit()
+    atlas = load_snake_atlas(cell_size)
+    color_rects = SNAKE_RECTS[color_index]
+    src_rects = tuple(_atlas_rect(rect_coords, cell_size) for rect_coords in color_rects)
+    _snake_rects_cache[cache_key] = (atlas, src_rects)
+    return atlas, src_rects
 
-    sheet = _snake_sprite_sheet_cache[SNAKE_SPRITE_SHEET]
-    apple_sprites = {}
 
-    for apple_type, rect_coords in APPLE_TILE_COORDS.items():
+def _apple_placeholder(cell_size: int, apple_state: int) -> pygame.Surface:
+    """Colored circle for a missing apple sprite, shared per cell size and apple state."""
+    cache_key = (apple_state, cell_size)
+    if cache_key not in _placeholder_cache:
+        placeholder = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+        color = APPLE_PLACEHOLDER_COLORS[apple_state] if apple_state < len(APPLE_PLACEHOLDER_COLORS) else (128,128,128)
+        pygame.draw.circle(placeholder, color, (cell_size//2, cell_size//2), cell_size//2)
+        _placeholder_cache[cache_key] = placeholder
+    return _placeholder_cache[cache_key]
+
+
+def load_apple_sprite_rects(cell_size: int) -> Tuple[pygame.Surface, Tuple[pygame.Rect, ...]]:
+    """Returns the scaled atlas and the source rect of every apple sprite, indexed by AppleState."""
+    atlas = load_snake_atlas(cell_size)
+    src_rects = tuple(_atlas_rect(rect_coords, cell_size) for rect_coords in APPLE_TILE_RECTS)
+    return atlas, src_rects
+
+
+def load_apple_sprites(cell_size: int) -> Tuple[pygame.Surface, ...]:
+    """Carves the apple sprites out of the pre-scaled Snake.png atlas, indexed by AppleState."""
+    if cell_size in _apple_sprites_cache:
+        return _apple_sprites_cache[cell_size]
+
+    atlas, src_rects = load_apple_sprite_rects(cell_size)
+    apple_sprites = []
+
+    for apple_state, src_rect in enumerate(src_rects):
         try:
-            sprite_image = sheet.subsurface(rect_coords)
-            apple_sprites[apple_type] = pygame.transform.scale(sprite_image, (cell_size, cell_size))
+            apple_sprites.append(atlas.subsurface(src_rect))
         except ValueError as e:
-            print(f"Error creating subsurface for apple '{apple_type}' with coords {rect_coords}: {e}")
+            print(f"Error creating subsurface for apple state {apple_state} with coords {src_rect}: {e}")
             print(f"Ensure '{SNAKE_SPRITE_SHEET}' contains this sprite at the specified coordinates.")
             print("Using a placeholder for this apple type.")
-            placeholder = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            color = {"good": (255,0,0), "warning": (255,255,0), "poisonous": (0,255,0)}.get(apple_type, (128,128,128))
-            pygame.draw.circle(placeholder, color, (cell_size//2, cell_size//2), cell_size//2)
-            apple_sprites[apple_type] = placeholder
-            
-    return apple_sprites
\ No newline at end of file
+            apple_sprites.append(_apple_placeholder(cell_size, apple_state))
+
+    _apple_sprites_cache[cell_size] = tuple(apple_sprites)
+    return _apple_sprites_cache[cell_size]
+
+
+def scale_surfaces(surfaces: List[pygame.Surface], size: Tuple[int, int]) -> List[pygame.Surface]:
+    """Scales equally sized surfaces to size with a single transform.scale call.
+    The surfaces are laid out side by side on one strip, scaled together and carved back out."""
+    if not surfaces:
+        return []
+    src_width, src_height = surfaces[0].get_size()
+    strip = pygame.Surface((src_width * len(surfaces), src_height), pygame.SRCALPHA)
+    # BLEND_RGBA_MAX copies each surface's alpha as-is onto the clear strip
+    strip.blits([(surface, (i * src_width, 0), None, pygame.BLEND_RGBA_MAX)
+                 for i, surface in enumerate(surfaces)], doreturn=False)
+    width, height = size
+    scaled = _convert_for_display(pygame.transform.scale(strip, (width * len(surfaces), height)))
+    return [scaled.subsurface((i * width, 0, width, height)) for i in range(len(surfaces))]
+
+
+def load_scaled_apple_sprites(cell_size: int, size: Tuple[int, int]) -> Tuple[pygame.Surface, ...]:
+    """Apple sprites for a cell size, scaled once to the drawn size. Uses caching."""
+    cache_key = (cell_size, size)
+    if cache_key not in _scaled_apple_sprites_cache:
+        _scaled_apple_sprites_cache[cache_key] = tuple(scale_surfaces(list(load_apple_sprites(cell_size)), size))
+    return _scaled_apple_sprites_cache[cache_key]
+
+
+def build_level_bg_surface(level_number: int, cell_size: int, cell_number: int,
+                           world_tileset_name: str = "world_tileset.png") -> Optional[pygame.Surface]:
+    """Renders a level's checkerboard background into one surface covering the whole grid.
+    Returns None if the level has no background tiles. Uses caching."""
+    cache_key = (level_number, cell_size, cell_number)
+    if cache_key in _level_bg_cache:
+        return _level_bg_cache[cache_key]
+
+    level_bg_data = LEVEL_BG_TILES.get(level_number, LEVEL_BG_TILES.get(1))
+    bg_surface = None
+    if level_bg_data:
+        tileset = get_tileset(world_tileset_name, 16, 16, cell_size)
+        tile1 = tileset.get_tile(*level_bg_data["primary"])
+        tile2 = tileset.get_tile(*level_bg_data["secondary"])
+        bg_surface = pygame.Surface((cell_number * cell_size, cell_number * cell_size)).convert()
+        tiles = (tile1, tile2)
+        tile_list = [(tiles[(row + col) % 2], (col * cell_size, row * cell_size))
+                     for row in range(cell_number) for col in range(cell_number)]
+        # Paint every cell in one call; fblits skips building the result rect list
+        fblits = getattr(bg_surface, "fblits", None)
+        if fblits is not None:
+            fblits(tile_list)
+        else:
+            bg_surface.blits(tile_list, doreturn=False)
+    _level_bg_cache[cache_key] = bg_surface
+    return bg_surface
+
+
+# Images and sounds decoded ahead of time by prefetch_assets
+PREFETCH_IMAGES = (SNAKE_SPRITE_SHEET, "world_tileset.png")
+
+def prefetch_assets():
+    """Decodes sprite sheets and sound effects so later loads skip file I/O.
+    The tilesets for the starting cell size are already built by then, so the sheets only help when a
+    difficulty change needs a Tileset at a new cell size that has no disk cache yet.
+    Runs on a background thread, so it never converts surfaces (that stays on the main thread)."""
+    try:
+        for filename in PREFETCH_IMAGES:
+            _load_raw_image(filename)
+        if _mixer_initialized:
+            sound_manager = get_sound_manager()
+            for sound_name in SoundManager.SOUND_FILES:
+                sound_manager._ensure_loaded(sound_name)
+    except Exception as e:
+        print(f"Warning: Asset prefetch failed: {e}")
+
+def start_asset_prefetch() -> threading.Thread:
+    """Starts prefetch_assets on a daemon thread."""
+    thread = threading.Thread(target=prefetch_assets, name="asset-prefetch", daemon=True)
+    thread.start()
+    return thread
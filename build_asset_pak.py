@@ -0,0 +1,40 @@
+"""Bundles Graphics/, Sound/ and Font/ into a single assets.pak file.
+
+Layout: the raw bytes of every asset back to back, then a JSON index mapping
+"Dir/filename" to [offset, length], then the index offset as a little-endian
+uint64 and ASSET_PAK_MAGIC. Re-run this after changing any asset; until then the
+game reads loose files that are newer than the pak instead of their packed copies.
+"""
+import json
+import os
+import struct
+from config import BASE_DIR, ASSET_PAK_FILE, ASSET_PAK_DIRS, ASSET_PAK_MAGIC
+
+
+def build_pak(output_path: str = ASSET_PAK_FILE) -> int:
+    index = {}
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as pak:
+        for asset_dir in ASSET_PAK_DIRS:
+            dir_path = os.path.join(BASE_DIR, asset_dir)
+            if not os.path.isdir(dir_path):
+                continue
+            for filename in sorted(os.listdir(dir_path)):
+                file_path = os.path.join(dir_path, filename)
+                if not os.path.isfile(file_path):
+                    continue
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                index[f"{asset_dir}/{filename}"] = [pak.tell(), len(data)]
+                pak.write(data)
+        index_offset = pak.tell()
+        pak.write(json.dumps(index).encode("utf-8"))
+        pak.write(struct.pack("<Q", index_offset))
+        pak.write(ASSET_PAK_MAGIC)
+    os.replace(tmp_path, output_path)
+    return len(index)
+
+
+if __name__ == "__main__":
+    count = build_pak()
+    print(f"Wrote {count} assets to {ASSET_PAK_FILE}")
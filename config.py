@@ -1,6 +1,5 @@
-import pygame
-import os
-from pygame.math import Vector2
+from pathlib import Path
+from typing import NamedTuple
 
 # --- Base Game Setup ---
 # FIXED Window Dimensions
@@ -11,6 +10,10 @@ HUD_WIDTH = 150           # Width of the HUD on the right side
 CELL_NUMBER_DEFAULT = 15 # Default, will change with difficulty
 CELL_SIZE_DEFAULT = 30   # Default cell size in pixels
 
+FPS = 60                 # Frame cap while anything on screen animates
+MAX_CATCHUP_STEPS = 3    # Most game steps run in one frame to make up for a slow frame
+STATIC_WAIT_MS = 200     # Longest idle wait for input on screens that only change on hover (pause, game over)
+
 # --- Audio Settings ---
 DEFAULT_VOLUME = 0.7     # Default volume level (0.0 to 1.0)
 VOLUME_STEP = 0.1        # Volume increment/decrement step
@@ -40,12 +43,18 @@ COLOR_BRIGHT_SCORE_TEXT = (180, 230, 120)
 COLOR_HUD_BG = (40, 50, 10)
 
 # --- File Paths ---
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-GRAPHICS_DIR = os.path.join(BASE_DIR, "Graphics")
-SOUND_DIR = os.path.join(BASE_DIR, "Sound")
-FONT_DIR = os.path.join(BASE_DIR, "Font")
-DATABASE_DIR = os.path.join(BASE_DIR, "Database")
-DB_FILE = os.path.join(DATABASE_DIR, "players_names.db")
+# Resolved once at import and stored as plain strings
+_BASE_PATH = Path(__file__).resolve().parent
+BASE_DIR = str(_BASE_PATH)
+GRAPHICS_DIR = str(_BASE_PATH / "Graphics")
+SOUND_DIR = str(_BASE_PATH / "Sound")
+FONT_DIR = str(_BASE_PATH / "Font")
+DATABASE_DIR = str(_BASE_PATH / "Database")
+DB_FILE = str(_BASE_PATH / "Database" / "players_names.db")
+CACHE_DIR = str(_BASE_PATH / ".cache") # Decoded asset cache, safe to delete
+ASSET_PAK_FILE = str(_BASE_PATH / "assets.pak") # Optional bundle built by build_asset_pak.py
+ASSET_PAK_DIRS = ("Graphics", "Sound", "Font")
+ASSET_PAK_MAGIC = b"SNAKEPAK"
 
 # --- Game Settings ---
 DEFAULT_PLAYER_NAME = "Player"
@@ -57,34 +66,43 @@ DEFAULT_PLAYER_NAME = "Player"
 # apple_warning_time: time before expiry when apple turns yellow (ms)
 # cell_number: grid size
 
+class DifficultyCfg(NamedTuple):
+    base_speed: int
+    obstacle_speed_factor: float
+    apple_expiry_enabled: bool
+    apple_total_life: float
+    apple_warning_time: float
+    poison_apple_life: int
+    cell_number: int
+
 DIFFICULTY_SETTINGS = {
-    "Easy": {
-        "base_speed": 250, # Slow speed
-        "obstacle_speed_factor": 1.2, # Slow obstacle speed
-        "apple_expiry_enabled": False, # Disables Apple expiry
-        "apple_total_life": float('inf'), # No expiry
-        "apple_warning_time": float('inf'),
-        "poison_apple_life": 5000,  # 5 seconds before poisonous apples despawn
-        "cell_number": 15,
-    },
-    "Moderate": {
-        "base_speed": 200, # Normal speed
-        "obstacle_speed_factor": 1.0, # Normal obstacle speed
-        "apple_expiry_enabled": True, # Enables Apple expiry
-        "apple_total_life": 15000, # 15 seconds
-        "apple_warning_time": 5000,  # Warn 5 seconds before expiry
-        "poison_apple_life": 7500,  # 7.5 seconds befor poisonous apples despawn
-        "cell_number": 20,
-    },
-    "Hard": {
-        "base_speed": 150, # Fast speed
-        "obstacle_speed_factor": 0.8, # Faster obstacle speed
-        "apple_expiry_enabled": True, # Enables Apple Expiry
-        "apple_total_life": 10000, # 10 seconds
-        "apple_warning_time": 3000,  # Warn 3 seconds before expiry
-        "poison_apple_life": 10000,  # 10 seconds for poisonous apples
-        "cell_number": 25,
-    }
+    "Easy": DifficultyCfg(
+        base_speed=250, # Slow speed
+        obstacle_speed_factor=1.2, # Slow obstacle speed
+        apple_expiry_enabled=False, # Disables Apple expiry
+        apple_total_life=float('inf'), # No expiry
+        apple_warning_time=float('inf'),
+        poison_apple_life=5000,  # 5 seconds before poisonous apples despawn
+        cell_number=15,
+    ),
+    "Moderate": DifficultyCfg(
+        base_speed=200, # Normal speed
+        obstacle_speed_factor=1.0, # Normal obstacle speed
+        apple_expiry_enabled=True, # Enables Apple expiry
+        apple_total_life=15000, # 15 seconds
+        apple_warning_time=5000,  # Warn 5 seconds before expiry
+        poison_apple_life=7500,  # 7.5 seconds befor poisonous apples despawn
+        cell_number=20,
+    ),
+    "Hard": DifficultyCfg(
+        base_speed=150, # Fast speed
+        obstacle_speed_factor=0.8, # Faster obstacle speed
+        apple_expiry_enabled=True, # Enables Apple Expiry
+        apple_total_life=10000, # 10 seconds
+        apple_warning_time=3000,  # Warn 3 seconds before expiry
+        poison_apple_life=10000,  # 10 seconds for poisonous apples
+        cell_number=25,
+    )
 }
 DEFAULT_DIFFICULTY = "Moderate"
 
@@ -93,32 +111,42 @@ DEFAULT_DIFFICULTY = "Moderate"
 # num_apples: how many apples on screen at a time for this level
 # num_obstacles: how many wall segments for this level
 # apple_spawn_delay: time in ms between apple spawns (if one is eaten/despawns)
+class LevelCfg(NamedTuple):
+    level: int
+    target_score: int
+    num_apples: int
+    num_obstacles: int
+    apple_spawn_delay: int
+
+# Used when a difficulty has no levels defined
+DEFAULT_LEVEL_CFG = LevelCfg(level=1, target_score=10, num_apples=1, num_obstacles=0, apple_spawn_delay=500)
+
 LEVEL_CONFIG = {
-    "Easy": [
-        {"level": 1, "target_score": 5,  "num_apples": 1, "num_obstacles": 0, "apple_spawn_delay": 500},
-        {"level": 2, "target_score": 10, "num_apples": 1, "num_obstacles": 3, "apple_spawn_delay": 500},
-        {"level": 3, "target_score": 15, "num_apples": 2, "num_obstacles": 5, "apple_spawn_delay": 700},
-        {"level": 4, "target_score": 20, "num_apples": 2, "num_obstacles": 7, "apple_spawn_delay": 700},
-        {"level": 5, "target_score": 25, "num_apples": 3, "num_obstacles": 10, "apple_spawn_delay": 1000},
-    ],
-    "Moderate": [
-        {"level": 1, "target_score": 10, "num_apples": 1, "num_obstacles": 0, "apple_spawn_delay": 500},
-        {"level": 2, "target_score": 20, "num_apples": 1, "num_obstacles": 3, "apple_spawn_delay": 500},
-        {"level": 3, "target_score": 30, "num_apples": 2, "num_obstacles": 5, "apple_spawn_delay": 700},
-        {"level": 4, "target_score": 40, "num_apples": 2, "num_obstacles": 7, "apple_spawn_delay": 700},
-        {"level": 5, "target_score": 50, "num_apples": 3, "num_obstacles": 10, "apple_spawn_delay": 1000},
-    ],
-    "Hard": [
-        {"level": 1, "target_score": 15, "num_apples": 1, "num_obstacles": 0, "apple_spawn_delay": 500},
-        {"level": 2, "target_score": 25, "num_apples": 1, "num_obstacles": 3, "apple_spawn_delay": 500},
-        {"level": 3, "target_score": 40, "num_apples": 2, "num_obstacles": 5, "apple_spawn_delay": 600},
-        {"level": 4, "target_score": 55, "num_apples": 2, "num_obstacles": 7, "apple_spawn_delay": 600},
-        {"level": 5, "target_score": 70, "num_apples": 3, "num_obstacles": 10, "apple_spawn_delay": 800},
-    ],
+    "Easy": (
+        LevelCfg(level=1, target_score=5, num_apples=1, num_obstacles=0, apple_spawn_delay=500),
+        LevelCfg(level=2, target_score=10, num_apples=1, num_obstacles=3, apple_spawn_delay=500),
+        LevelCfg(level=3, target_score=15, num_apples=2, num_obstacles=5, apple_spawn_delay=700),
+        LevelCfg(level=4, target_score=20, num_apples=2, num_obstacles=7, apple_spawn_delay=700),
+        LevelCfg(level=5, target_score=25, num_apples=3, num_obstacles=10, apple_spawn_delay=1000),
+    ),
+    "Moderate": (
+        LevelCfg(level=1, target_score=10, num_apples=1, num_obstacles=0, apple_spawn_delay=500),
+        LevelCfg(level=2, target_score=20, num_apples=1, num_obstacles=3, apple_spawn_delay=500),
+        LevelCfg(level=3, target_score=30, num_apples=2, num_obstacles=5, apple_spawn_delay=700),
+        LevelCfg(level=4, target_score=40, num_apples=2, num_obstacles=7, apple_spawn_delay=700),
+        LevelCfg(level=5, target_score=50, num_apples=3, num_obstacles=10, apple_spawn_delay=1000),
+    ),
+    "Hard": (
+        LevelCfg(level=1, target_score=15, num_apples=1, num_obstacles=0, apple_spawn_delay=500),
+        LevelCfg(level=2, target_score=25, num_apples=1, num_obstacles=3, apple_spawn_delay=500),
+        LevelCfg(level=3, target_score=40, num_apples=2, num_obstacles=5, apple_spawn_delay=600),
+        LevelCfg(level=4, target_score=55, num_apples=2, num_obstacles=7, apple_spawn_delay=600),
+        LevelCfg(level=5, target_score=70, num_apples=3, num_obstacles=10, apple_spawn_delay=800),
+    ),
 }
 
 # --- Game State Enum ---
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 class GameState(Enum):
     NAME_INPUT = auto()
     WELCOME = auto()
@@ -134,6 +162,20 @@ class GameState(Enum):
     GAME_COMPLETED = auto()
     QUITTING = auto()
 
+# Apple states double as indexes into APPLE_TILE_RECTS and the loaded apple sprite tuples
+class AppleState(IntEnum):
+    GOOD = 0
+    WARNING = 1 # About to expire or turn poisonous
+    POISONOUS = 2
+    EXPIRED = 3 # For internal handling if it just despawns
+
+# Outcome of one Snake.step, in the order the collisions are checked
+class MoveResult(IntEnum):
+    OK = 0
+    OUT_OF_BOUNDS = 1
+    HIT_WALL = 2
+    HIT_SELF = 3
+
 # --- Background Tile Definitions for Levels (using world_tileset.png) ---
 LEVEL_BG_TILES = {
     # Each level can have a primary fill tile and an alternative for checkerboard
@@ -151,74 +193,108 @@ SNAKE_SPRITE_SHEET = "Snake.png"
 SNAKE_TILE_SIZE = 16 
 
 # --- Apple Tile Definitions (from Snake.png) ---
-APPLE_TILE_COORDS = {
-    "good": pygame.Rect(0 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),      # Red apple
-    "warning": pygame.Rect(2 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),   # Yellow apple (for expiring)
-    "poisonous": pygame.Rect(1 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), # Green apple
-}
+# Indexed by AppleState (GOOD, WARNING, POISONOUS)
+APPLE_TILE_RECTS = (
+    (0 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), # Red apple
+    (2 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), # Yellow apple (for expiring)
+    (1 * SNAKE_TILE_SIZE, 21 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), # Green apple
+)
+APPLE_PLACEHOLDER_COLORS = ((255,0,0), (255,255,0), (0,255,0)) # Same order as APPLE_TILE_RECTS
 POISON_APPLE_CHANCE = 0.1 # 10% chance a new apple is poisonous (if not good/warning)
 APPLE_VISUAL_SCALE_FACTOR = 1.4 # Apples will be drawn 40% larger than cell_size
 
 # --- Snake Tile Definitions (from Snake.png) ---
 SNAKE_GRAPHICS_COORDS = {
     "yellow": {
-        "head_up":    pygame.Rect(6 * SNAKE_TILE_SIZE, 3 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 5 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_right": pygame.Rect(6 * SNAKE_TILE_SIZE, 6 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_left":  pygame.Rect(6 * SNAKE_TILE_SIZE, 4 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-
-        "tail_up":    pygame.Rect(8 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "tail_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "tail_right": pygame.Rect(7 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "tail_left":  pygame.Rect(9 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-
-        "body_vertical": pygame.Rect(0 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "body_horizontal": pygame.Rect(1 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-
-        "body_tr": pygame.Rect(2 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "body_tl": pygame.Rect(3 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_br": pygame.Rect(4 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_bl": pygame.Rect(5 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "head_up":    (6 * SNAKE_TILE_SIZE, 3 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_down":  (6 * SNAKE_TILE_SIZE, 5 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_right": (6 * SNAKE_TILE_SIZE, 6 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_left":  (6 * SNAKE_TILE_SIZE, 4 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+
+        "tail_up":    (8 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "tail_down":  (6 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "tail_right": (7 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "tail_left":  (9 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+
+        "body_vertical": (0 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "body_horizontal": (1 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+
+        "body_tr": (2 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "body_tl": (3 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_br": (4 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_bl": (5 * SNAKE_TILE_SIZE, 2 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
     },
     "green": {
-        "head_up":    pygame.Rect(6 * SNAKE_TILE_SIZE, 10 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 12 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_right": pygame.Rect(6 * SNAKE_TILE_SIZE, 13 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_left":  pygame.Rect(6 * SNAKE_TILE_SIZE, 11 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-
-        "tail_up":    pygame.Rect(8 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_right": pygame.Rect(7 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_left":  pygame.Rect(9 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-
-        "body_vertical": pygame.Rect(0 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_horizontal": pygame.Rect(1 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-
-        "body_tr": pygame.Rect(2 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_tl": pygame.Rect(3 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_br": pygame.Rect(4 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_bl": pygame.Rect(5 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "head_up":    (6 * SNAKE_TILE_SIZE, 10 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_down":  (6 * SNAKE_TILE_SIZE, 12 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_right": (6 * SNAKE_TILE_SIZE, 13 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_left":  (6 * SNAKE_TILE_SIZE, 11 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+
+        "tail_up":    (8 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_down":  (6 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_right": (7 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_left":  (9 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+
+        "body_vertical": (0 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_horizontal": (1 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+
+        "body_tr": (2 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_tl": (3 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_br": (4 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_bl": (5 * SNAKE_TILE_SIZE, 9 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
     },
     "blue": {
-        "head_up":    pygame.Rect(6 * SNAKE_TILE_SIZE, 17 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 19 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "head_right": pygame.Rect(6 * SNAKE_TILE_SIZE, 20 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-        "head_left":  pygame.Rect(6 * SNAKE_TILE_SIZE, 18 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
-
-        "tail_up":    pygame.Rect(8 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_down":  pygame.Rect(6 * SNAKE_TILE_SIZE, 16* SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_right": pygame.Rect(7 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "tail_left":  pygame.Rect(9 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-
-        "body_vertical": pygame.Rect(0 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_horizontal": pygame.Rect(1 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-
-        "body_tr": pygame.Rect(2 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_tl": pygame.Rect(3 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_br": pygame.Rect(4 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
-        "body_bl": pygame.Rect(5 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "head_up":    (6 * SNAKE_TILE_SIZE, 17 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_down":  (6 * SNAKE_TILE_SIZE, 19 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "head_right": (6 * SNAKE_TILE_SIZE, 20 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+        "head_left":  (6 * SNAKE_TILE_SIZE, 18 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE),
+
+        "tail_up":    (8 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_down":  (6 * SNAKE_TILE_SIZE, 16* SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_right": (7 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "tail_left":  (9 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+
+        "body_vertical": (0 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_horizontal": (1 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+
+        "body_tr": (2 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_tl": (3 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_br": (4 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
+        "body_bl": (5 * SNAKE_TILE_SIZE, 16 * SNAKE_TILE_SIZE, SNAKE_TILE_SIZE, SNAKE_TILE_SIZE), 
     }
 }
+
+# --- Packed Snake Sprite Lookup Table ---
+# SNAKE_RECTS[color_index][part_index] -> (x, y, w, h) on Snake.png, built once from the
+# literal above, which is then dropped so only the compact tuples stay alive.
+SNAKE_PART_NAMES = (
+    "head_up", "head_down", "head_left", "head_right",
+    "tail_up", "tail_down", "tail_left", "tail_right",
+    "body_vertical", "body_horizontal",
+    "body_tr", "body_tl", "body_br", "body_bl",
+)
+STANDARD_SNAKE_PARTS = frozenset(SNAKE_PART_NAMES)
+SNAKE_PART_INDEX = {part: i for i, part in enumerate(SNAKE_PART_NAMES)}
+# Small integer ids for the parts (SnakePart.HEAD_UP == 0, ...), used to index SNAKE_RECTS rows
+SnakePart = IntEnum("SnakePart", [(part.upper(), i) for i, part in enumerate(SNAKE_PART_NAMES)])
+
+def _validate_snake_coords():
+    """Checks once at import that every color defines exactly the standard parts."""
+    for color, parts in SNAKE_GRAPHICS_COORDS.items():
+        if parts.keys() != STANDARD_SNAKE_PARTS:
+            missing = sorted(STANDARD_SNAKE_PARTS - parts.keys())
+            unknown = sorted(parts.keys() - STANDARD_SNAKE_PARTS)
+            raise RuntimeError(f"SNAKE_GRAPHICS_COORDS['{color}'] is invalid. Missing: {missing}, unknown: {unknown}")
+
+_validate_snake_coords()
+SNAKE_COLOR_INDEX = {color: i for i, color in enumerate(SNAKE_GRAPHICS_COORDS)}
+SNAKE_RECTS = tuple(
+    tuple(SNAKE_GRAPHICS_COORDS[color][part] for part in SNAKE_PART_NAMES)
+    for color in SNAKE_COLOR_INDEX
+)
+del SNAKE_GRAPHICS_COORDS
+
 # Define Snake Colors
-SNAKE_COLORS_AVAILABLE = list(SNAKE_GRAPHICS_COORDS.keys())
+SNAKE_COLORS_AVAILABLE = tuple(SNAKE_COLOR_INDEX) # Ordered, for cycling through colors in the UI
+VALID_SNAKE_COLORS = frozenset(SNAKE_COLORS_AVAILABLE) # For membership checks
 DEFAULT_SNAKE_COLOR = "green"
\ No newline at end of file
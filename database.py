@@ -1,79 +1,182 @@
 import sqlite3
 import os
+import sys
 from typing import Optional, List, Dict, Any
-from config import DB_FILE, DATABASE_DIR, LEVEL_CONFIG, DEFAULT_VOLUME, DEFAULT_SNAKE_COLOR, SNAKE_COLORS_AVAILABLE
+from config import DB_FILE, DATABASE_DIR, LEVEL_CONFIG, DEFAULT_VOLUME, DEFAULT_SNAKE_COLOR, SNAKE_COLORS_AVAILABLE, VALID_SNAKE_COLORS
 
 MAX_LEVELS_PER_DIFFICULTY = {
     diff: len(levels) for diff, levels in LEVEL_CONFIG.items()
 }
 
+# Canonical interned strings for values read back from the database, so cached rows share
+# the same objects as the config keys they are compared against
+_DIFFS = {diff: sys.intern(diff) for diff in LEVEL_CONFIG}
+_COLORS = {color: sys.intern(color) for color in SNAKE_COLORS_AVAILABLE}
+
+_VALID_DIFFICULTIES = frozenset(LEVEL_CONFIG)
+
+# Highest unlocked level per difficulty, packed into one integer: one 4-bit field per difficulty
+UNLOCK_FIELD_BITS = 4
+UNLOCK_FIELD_MASK = (1 << UNLOCK_FIELD_BITS) - 1
+_UNLOCK_SHIFT = {diff: i * UNLOCK_FIELD_BITS for i, diff in enumerate(LEVEL_CONFIG)}
+# Level 1 unlocked for every difficulty (0x111)
+DEFAULT_UNLOCKED_BITS = sum(1 << shift for shift in _UNLOCK_SHIFT.values())
+# Columns that stored the unlocked levels before they were packed into unlocked_bits
+_LEGACY_UNLOCK_COLUMNS = {diff: f"unlocked_{diff.lower()}" for diff in LEVEL_CONFIG}
+
+# --- SQL statements ---
+# Module-level constants so every call passes the same text and hits the connection's statement cache
+SQL_CREATE_PLAYERS = f"""
+    CREATE TABLE IF NOT EXISTS players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        high_score INTEGER DEFAULT 0,
+        difficulty TEXT, 
+        highest_level INTEGER DEFAULT 1, -- Highest level reached in last played difficulty
+        games_played INTEGER DEFAULT 0,
+        last_played TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        unlocked_bits INTEGER DEFAULT {DEFAULT_UNLOCKED_BITS}, -- Highest level unlocked per difficulty, 4 bits each
+        volume REAL DEFAULT {DEFAULT_VOLUME},
+        snake_color TEXT DEFAULT '{DEFAULT_SNAKE_COLOR}'
+    )
+"""
+SQL_CREATE_NAME_INDEX = "CREATE INDEX IF NOT EXISTS idx_player_name ON players (name);"
+# Covers the leaderboard query so it is a LIMIT-bounded index walk with no table lookups or sort
+SQL_CREATE_LEADERBOARD_INDEX = "CREATE INDEX IF NOT EXISTS idx_leaderboard ON players (high_score DESC, name, difficulty, highest_level);"
+SQL_TABLE_INFO = "PRAGMA table_info(players)"
+SQL_UPSERT_PLAYER = ("INSERT INTO players (name) VALUES (?) "
+                     "ON CONFLICT(name) DO UPDATE SET name = excluded.name RETURNING id")
+SQL_INSERT_PLAYER = "INSERT OR IGNORE INTO players (name) VALUES (?)"
+SQL_GET_PLAYER_ID = "SELECT id FROM players WHERE name = ?"
+SQL_SET_NAME = "UPDATE players SET name = ? WHERE id = ?"
+SQL_UPDATE_SCORE = """
+    UPDATE players SET
+    games_played = games_played + 1,
+    last_played = CURRENT_TIMESTAMP,
+    difficulty = ?,
+    highest_level = MAX(highest_level, ?), -- highest level reached in this game session
+    high_score = MAX(high_score, ?)
+    WHERE id = ?
+"""
+# Replaces one difficulty's 4-bit field: params are (field mask, new value << shift, id)
+SQL_SET_UNLOCKED_LEVEL = "UPDATE players SET unlocked_bits = (unlocked_bits & ~?) | ? WHERE id = ?"
+SQL_SET_VOLUME = "UPDATE players SET volume = ? WHERE id = ?"
+SQL_SET_DIFFICULTY = "UPDATE players SET difficulty = ? WHERE id = ?"
+SQL_SET_SNAKE_COLOR = "UPDATE players SET snake_color = ? WHERE id = ?"
+SQL_TOP_PLAYERS = """
+    SELECT name, high_score, difficulty, highest_level
+    FROM players
+    ORDER BY high_score DESC
+    LIMIT ?
+"""
+SQL_GET_PLAYER = ("SELECT name, high_score, difficulty, highest_level, unlocked_bits, "
+                  "volume, snake_color FROM players WHERE id = ?")
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Columns added after the original schema; older databases are migrated on startup
+REQUIRED_COLUMNS = (
+    ("unlocked_bits", f"INTEGER DEFAULT {DEFAULT_UNLOCKED_BITS}"),
+    ("volume", f"REAL DEFAULT {DEFAULT_VOLUME}"),
+    ("snake_color", f"TEXT DEFAULT '{DEFAULT_SNAKE_COLOR}'"),
+)
+
 class PlayerDatabase:
     def __init__(self, db_file=DB_FILE):
         self.db_file = db_file
-        os.makedirs(os.path.dirname(db_file), exist_ok=True)
-        self._initialize_db()
+        db_dir = os.path.dirname(db_file)
+        if db_dir and not os.path.isdir(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+        # Opened, and the schema prepared, by the first query rather than at startup
+        self._conn: Optional[sqlite3.Connection] = None
+        # Rows returned by get_player_data, kept up to date by the update_* methods
+        self._player_cache: Dict[int, Dict[str, Any]] = {}
+        # get_top_players results keyed by limit; cleared by any write that changes the leaderboard
+        self._leaderboard_cache: Dict[int, List[Dict[str, Any]]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the shared connection, opening it and initializing the schema on first use."""
+        if self._conn is None:
+            # One connection for the lifetime of the game; autocommit mode commits each statement
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None,
+                                         cached_statements=128)
+            # Rows support access by column name and convert straight to dicts
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._initialize_db()
+        return self._conn
+
+    def close(self):
+        """Closes the shared connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _execute(self, query: str, params: tuple = (),
                  fetch_one=False, fetch_all=False):
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
-                if fetch_one:
-                    return cursor.fetchone()
-                if fetch_all:
-                    return cursor.fetchall()
-                return cursor
+            cursor = self._connect().execute(query, params)
+            if fetch_one:
+                return cursor.fetchone()
+            if fetch_all:
+                return cursor.fetchall()
+            return cursor
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return None
 
     def _initialize_db(self):
+        self._execute(SQL_CREATE_PLAYERS)
+        self._execute(SQL_CREATE_NAME_INDEX)
+        self._execute(SQL_CREATE_LEADERBOARD_INDEX)
+        self._add_missing_columns()
 
-        create_table_query = f"""
-            CREATE TABLE IF NOT EXISTS players (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                high_score INTEGER DEFAULT 0,
-                difficulty TEXT, 
-                highest_level INTEGER DEFAULT 1, -- Highest level reached in last played difficulty
-                games_played INTEGER DEFAULT 0,
-                last_played TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                unlocked_easy INTEGER DEFAULT 1,    -- Highest level unlocked for Easy
-                unlocked_moderate INTEGER DEFAULT 1, -- Highest level unlocked for Moderate
-                unlocked_hard INTEGER DEFAULT 1,      -- Highest level unlocked for Hard
-                volume REAL DEFAULT {DEFAULT_VOLUME},
-                snake_color TEXT DEFAULT '{DEFAULT_SNAKE_COLOR}'
-            )
-        """
-        self._execute(create_table_query)
-        self._execute("CREATE INDEX IF NOT EXISTS idx_player_name ON players (name);")
-        
-        self._add_column_if_not_exists("players", "unlocked_easy", "INTEGER DEFAULT 1")
-        self._add_column_if_not_exists("players", "unlocked_moderate", "INTEGER DEFAULT 1")
-        self._add_column_if_not_exists("players", "unlocked_hard", "INTEGER DEFAULT 1")
-        self._add_column_if_not_exists("players", "volume", f"REAL DEFAULT {DEFAULT_VOLUME}")
-        self._add_column_if_not_exists("players", "snake_color", f"TEXT DEFAULT '{DEFAULT_SNAKE_COLOR}'")
-
-    def _add_column_if_not_exists(self, table_name, column_name, column_definition):
-        cursor = self._execute(f"PRAGMA table_info({table_name})")
-        if cursor:
-            columns = [row[1] for row in cursor.fetchall()]
-            if column_name not in columns:
-                self._execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_definition}")
-                print(f"Added column '{column_name}' to table '{table_name}'.")
+    def _add_missing_columns(self):
+        """Reads the players schema once and adds any REQUIRED_COLUMNS it lacks in one transaction."""
+        rows = self._execute(SQL_TABLE_INFO, fetch_all=True)
+        if rows is None:
+            return
+        existing = {row[1] for row in rows}
+        missing = [(name, definition) for name, definition in REQUIRED_COLUMNS if name not in existing]
+        if not missing:
+            return
+        try:
+            self._conn.execute("BEGIN")
+            for column_name, column_definition in missing:
+                self._conn.execute(f"ALTER TABLE players ADD COLUMN {column_name} {column_definition}")
+            if "unlocked_bits" not in existing:
+                # Fold the old per-difficulty columns into the new bitmask
+                fields = " | ".join(
+                    f"(COALESCE({column}, 1) << {_UNLOCK_SHIFT[diff]})" if column in existing else f"(1 << {_UNLOCK_SHIFT[diff]})"
+                    for diff, column in _LEGACY_UNLOCK_COLUMNS.items()
+                )
+                self._conn.execute(f"UPDATE players SET unlocked_bits = {fields}")
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self._conn.execute("ROLLBACK")
+            print(f"Database error while migrating players table: {e}")
+            return
+        for column_name, _ in missing:
+            print(f"Added column '{column_name}' to table 'players'.")
 
     def add_player(self, name: str) -> Optional[int]:
         name = name.strip()
         if not name:
             return None
+        self._leaderboard_cache.clear()
+
+        if _HAS_RETURNING:
+            # Returns the id whether the row was inserted or already existed; all rows are
+            # fetched so the statement finishes before the connection is reused
+            rows = self._execute(SQL_UPSERT_PLAYER, (name,), fetch_all=True)
+            return rows[0][0] if rows else None
 
-        insert_query = "INSERT OR IGNORE INTO players (name) VALUES (?)"
-        self._execute(insert_query, (name,))
+        self._execute(SQL_INSERT_PLAYER, (name,))
         
-        select_query = "SELECT id FROM players WHERE name = ?"
-        result = self._execute(select_query, (name,), fetch_one=True)
+        result = self._execute(SQL_GET_PLAYER_ID, (name,), fetch_one=True)
         return result[0] if result else None
 
     def update_player_name(self, player_id: int, new_name: str) -> bool:
@@ -81,13 +184,11 @@ class PlayerDatabase:
         if not new_name or player_id is None:
             return False
 
-        update_query = "UPDATE players SET name = ? WHERE id = ?"
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(update_query, (new_name, player_id))
-                conn.commit()
-                return conn.total_changes > 0
+            cursor = self._connect().execute(SQL_SET_NAME, (new_name, player_id))
+            self._player_cache.pop(player_id, None)
+            self._leaderboard_cache.clear()
+            return cursor.rowcount > 0
         except sqlite3.IntegrityError:
             print(f"Database IntegrityError: Name '{new_name}' might already exist.")
             return False
@@ -97,40 +198,83 @@ class PlayerDatabase:
 
     def update_player_score(self, player_id: int, score: int, difficulty: str, level_reached: int):
         """Updates player's general game stats. Level unlocking is separate."""
-        update_query = """
-            UPDATE players SET
-            games_played = games_played + 1,
-            last_played = CURRENT_TIMESTAMP,
-            difficulty = ?,
-            highest_level = MAX(highest_level, ?), -- highest level reached in this game session
-            high_score = MAX(high_score, ?)
-            WHERE id = ?
-        """
-        self._execute(update_query, (difficulty, level_reached, score, player_id))
+        self._leaderboard_cache.clear()
+        if self._execute(SQL_UPDATE_SCORE, (difficulty, level_reached, score, player_id)) is not None:
+            self._cache_score(player_id, score, difficulty, level_reached)
+
+    def _cache_score(self, player_id: int, score: int, difficulty: str, level_reached: int):
+        cached = self._player_cache.get(player_id)
+        if cached:
+            cached["difficulty"] = difficulty
+            cached["highest_level"] = max(cached["highest_level"] or 0, level_reached)
+            cached["high_score"] = max(cached["high_score"] or 0, score)
 
     def get_unlocked_level(self, player_id: int, difficulty: str) -> int:
         """Gets the highest unlocked level for a specific difficulty."""
-        if player_id is None or difficulty not in ["Easy", "Moderate", "Hard"]:
+        if player_id is None or difficulty not in _VALID_DIFFICULTIES:
             return 1 
         
-        column_name = f"unlocked_{difficulty.lower()}"
-        query = f"SELECT {column_name} FROM players WHERE id = ?"
-        result = self._execute(query, (player_id,), fetch_one=True)
-        return result[0] if result and result[0] is not None else 1
+        player_data = self.get_player_data(player_id)
+        unlocked = player_data["unlocked_levels"][difficulty] if player_data else None
+        return unlocked if unlocked is not None else 1
+
+    def _level_to_unlock(self, player_id: int, difficulty: str, completed_level_number: int) -> Optional[int]:
+        """The level completing this one unlocks, or None if it unlocks nothing new."""
+        max_levels_for_difficulty = MAX_LEVELS_PER_DIFFICULTY.get(difficulty)
+        if player_id is None or max_levels_for_difficulty is None:
+            return None
+
+        next_level_to_unlock = completed_level_number + 1
+        if next_level_to_unlock > max_levels_for_difficulty:
+            return None
+
+        if completed_level_number != self.get_unlocked_level(player_id, difficulty):
+            return None
+        return next_level_to_unlock
+
+    def _unlock_params(self, player_id: int, difficulty: str, level: int) -> tuple:
+        shift = _UNLOCK_SHIFT[difficulty]
+        return (UNLOCK_FIELD_MASK << shift, level << shift, player_id)
+
+    def _cache_unlock(self, player_id: int, difficulty: str, level: int):
+        cached = self._player_cache.get(player_id)
+        if cached:
+            cached["unlocked_levels"][difficulty] = level
 
     def unlock_next_level(self, player_id: int, difficulty: str, completed_level_number: int):
         """Unlocks the next level if the completed level was the highest unlocked so far."""
-        if player_id is None or difficulty not in MAX_LEVELS_PER_DIFFICULTY:
+        next_level_to_unlock = self._level_to_unlock(player_id, difficulty, completed_level_number)
+        if next_level_to_unlock is None:
             return
 
-        current_unlocked = self.get_unlocked_level(player_id, difficulty)
-        next_level_to_unlock = completed_level_number + 1
-        max_levels_for_difficulty = MAX_LEVELS_PER_DIFFICULTY[difficulty]
+        if self._execute(SQL_SET_UNLOCKED_LEVEL, self._unlock_params(player_id, difficulty, next_level_to_unlock)) is not None:
+            self._cache_unlock(player_id, difficulty, next_level_to_unlock)
+        print(f"Player {player_id} unlocked {difficulty} level {next_level_to_unlock}")
+
+    def record_level_complete(self, player_id: int, score: int, difficulty: str, completed_level_number: int):
+        """Updates the player's stats and unlocks the next level in a single transaction."""
+        if player_id is None:
+            return
+        next_level_to_unlock = self._level_to_unlock(player_id, difficulty, completed_level_number)
+        conn = self._connect()
+        try:
+            # Statements run on the connection directly so a failure aborts the whole transaction
+            conn.execute("BEGIN")
+            conn.execute(SQL_UPDATE_SCORE, (difficulty, completed_level_number, score, player_id))
+            if next_level_to_unlock is not None:
+                conn.execute(SQL_SET_UNLOCKED_LEVEL, self._unlock_params(player_id, difficulty, next_level_to_unlock))
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            print(f"Database error in record_level_complete: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return
 
-        if completed_level_number == current_unlocked and next_level_to_unlock <= max_levels_for_difficulty:
-            column_name = f"unlocked_{difficulty.lower()}"
-            update_query = f"UPDATE players SET {column_name} = ? WHERE id = ?"
-            self._execute(update_query, (next_level_to_unlock, player_id))
+        # Caches only change once the writes are committed
+        self._leaderboard_cache.clear()
+        self._cache_score(player_id, score, difficulty, completed_level_number)
+        if next_level_to_unlock is not None:
+            self._cache_unlock(player_id, difficulty, next_level_to_unlock)
             print(f"Player {player_id} unlocked {difficulty} level {next_level_to_unlock}")
 
     def get_player_volume(self, player_id: int) -> float:
@@ -138,9 +282,9 @@ class PlayerDatabase:
         if player_id is None:
             return DEFAULT_VOLUME
             
-        query = "SELECT volume FROM players WHERE id = ?"
-        result = self._execute(query, (player_id,), fetch_one=True)
-        return result[0] if result and result[0] is not None else DEFAULT_VOLUME
+        player_data = self.get_player_data(player_id)
+        volume = player_data["volume"] if player_data else None
+        return volume if volume is not None else DEFAULT_VOLUME
         
     def update_player_volume(self, player_id: int, volume: float) -> bool:
         """Updates the player's volume setting."""
@@ -149,27 +293,27 @@ class PlayerDatabase:
             
         volume = max(0.0, min(1.0, volume))
         
-        update_query = "UPDATE players SET volume = ? WHERE id = ?"
-        self._execute(update_query, (volume, player_id))
+        if self._execute(SQL_SET_VOLUME, (volume, player_id)) is not None:
+            self._update_cached(player_id, "volume", volume)
         return True
         
     def update_player_difficulty(self, player_id: int, difficulty: str) -> bool:
         """Updates the player's preferred difficulty setting."""
-        if player_id is None or difficulty not in ["Easy", "Moderate", "Hard"]:
+        if player_id is None or difficulty not in _VALID_DIFFICULTIES:
             return False
             
-        update_query = "UPDATE players SET difficulty = ? WHERE id = ?"
-        self._execute(update_query, (difficulty, player_id))
+        if self._execute(SQL_SET_DIFFICULTY, (difficulty, player_id)) is not None:
+            self._update_cached(player_id, "difficulty", difficulty)
         return True
 
     def update_player_snake_color(self, player_id: int, color: str) -> bool:
         """Updates the player's preferred snake color."""
-        if player_id is None or color not in SNAKE_COLORS_AVAILABLE:
+        if player_id is None or color not in VALID_SNAKE_COLORS:
             print(f"Invalid snake color {color} or player_id {player_id} for update.")
             return False
         
-        update_query = "UPDATE players SET snake_color = ? WHERE id = ?"
-        self._execute(update_query, (color, player_id))
+        if self._execute(SQL_SET_SNAKE_COLOR, (color, player_id)) is not None:
+            self._update_cached(player_id, "snake_color", color)
         return True
 
     def get_player_snake_color(self, player_id: int) -> str:
@@ -177,41 +321,46 @@ class PlayerDatabase:
         if player_id is None:
             return DEFAULT_SNAKE_COLOR
             
-        query = "SELECT snake_color FROM players WHERE id = ?"
-        result = self._execute(query, (player_id,), fetch_one=True)
-        return result[0] if result and result[0] else DEFAULT_SNAKE_COLOR
+        player_data = self.get_player_data(player_id)
+        return player_data["snake_color"] if player_data else DEFAULT_SNAKE_COLOR
 
     def get_top_players(self, limit: int = 10) -> List[Dict[str, Any]]:
-        select_query = """
-            SELECT name, high_score, difficulty, highest_level
-            FROM players
-            ORDER BY high_score DESC
-            LIMIT ?
-        """
-        cursor = self._execute(select_query, (limit,), fetch_all=True)
-        if cursor:
-            top_players = [
-                {"name": row[0], "high_score": row[1], "difficulty": row[2], "highest_level": row[3]}
-                for row in cursor
-            ]
+        """Returns the leaderboard, querying SQLite only after it has changed."""
+        cached = self._leaderboard_cache.get(limit)
+        if cached is not None:
+            return cached
+        rows = self._execute(SQL_TOP_PLAYERS, (limit,), fetch_all=True)
+        if rows:
+            top_players = [dict(row) for row in rows]
+            self._leaderboard_cache[limit] = top_players
             return top_players
         return []
 
+    def _update_cached(self, player_id: int, key: str, value: Any):
+        cached = self._player_cache.get(player_id)
+        if cached:
+            cached[key] = value
+
     def get_player_data(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """Returns the player's row, read from SQLite only on first access."""
         if player_id is None:
             return None
-        query = "SELECT name, high_score, difficulty, highest_level, unlocked_easy, unlocked_moderate, unlocked_hard, volume, snake_color FROM players WHERE id = ?"
-        row = self._execute(query, (player_id,), fetch_one=True)
+        cached = self._player_cache.get(player_id)
+        if cached:
+            return cached
+        row = self._execute(SQL_GET_PLAYER, (player_id,), fetch_one=True)
         if row:
-            return {
-                "name": row[0], "high_score": row[1], "difficulty": row[2],
-                "highest_level": row[3],
+            difficulty, snake_color = row["difficulty"], row["snake_color"]
+            unlocked_bits = row["unlocked_bits"] if row["unlocked_bits"] is not None else DEFAULT_UNLOCKED_BITS
+            player_data = {
+                "name": row["name"], "high_score": row["high_score"], "difficulty": _DIFFS.get(difficulty, difficulty),
+                "highest_level": row["highest_level"],
                 "unlocked_levels": {
-                    "Easy": row[4],
-                    "Moderate": row[5],
-                    "Hard": row[6]
+                    diff: (unlocked_bits >> shift) & UNLOCK_FIELD_MASK for diff, shift in _UNLOCK_SHIFT.items()
                 },
-                "volume": row[7],
-                "snake_color": row[8] if row[8] else DEFAULT_SNAKE_COLOR
+                "volume": row["volume"],
+                "snake_color": _COLORS.get(snake_color, snake_color) if snake_color else DEFAULT_SNAKE_COLOR
             }
+            self._player_cache[player_id] = player_data
+            return player_data
         return None
\ No newline at end of file
@@ -1,31 +1,58 @@
 import pygame
 import sys
 import time
-from pygame.math import Vector2
+import heapq
+from functools import partial
 from typing import List, Tuple, Optional, Dict, Any
 
 from config import (
-    GameState, DEFAULT_DIFFICULTY, DIFFICULTY_SETTINGS, LEVEL_CONFIG, FIXED_SCREEN_WIDTH, FIXED_SCREEN_HEIGHT, HUD_WIDTH,
+    GameState, MoveResult, DEFAULT_DIFFICULTY, DIFFICULTY_SETTINGS, LEVEL_CONFIG, FIXED_SCREEN_WIDTH, FIXED_SCREEN_HEIGHT, HUD_WIDTH,
     COLOR_WHITE, COLOR_BLACK, COLOR_RED, COLOR_YELLOW, COLOR_GREEN, COLOR_GRASS_1, COLOR_GRASS_2, COLOR_DARK_GREEN,
     COLOR_BUTTON_NORMAL, COLOR_BUTTON_HOVER, COLOR_BUTTON_BACK_NORMAL, COLOR_BUTTON_BACK_HOVER,
     COLOR_BUTTON_HIGHLIGHT, COLOR_BUTTON_HIGHLIGHT_HOVER,
     COLOR_SCORE_TEXT, COLOR_LIGHT_GREEN, DEFAULT_PLAYER_NAME, COLOR_HUD_BG, DEFAULT_VOLUME, VOLUME_STEP,
-    SNAKE_COLORS_AVAILABLE, DEFAULT_SNAKE_COLOR, COLOR_BRIGHT_SCORE_TEXT
+    SNAKE_COLORS_AVAILABLE, VALID_SNAKE_COLORS, DEFAULT_SNAKE_COLOR, COLOR_BRIGHT_SCORE_TEXT,
+    FPS, STATIC_WAIT_MS, MAX_CATCHUP_STEPS
 )
 from assets import (
-    load_font, load_gif_frames, load_image, get_tileset, load_apple_sprites, sound_manager
+    load_font, load_gif_frames, load_image, get_tileset, load_apple_sprites, load_scaled_apple_sprites, get_sound_manager,
+    start_asset_prefetch, CachedFont, SoundManager
 )
 from database import PlayerDatabase
 from ui_elements import TextInput, Button, Slider
-from game_objects import Snake, Fruit, Wall, Background, AppleState 
+from game_objects import Snake, Fruit, FruitPool, FreeCells, Wall, Background, AppleState 
 from level_manager import LevelManager
 
+# States whose frame only changes on hover or state change; these present dirty rects instead of flipping
+STATIC_PRESENT_STATES = frozenset({GameState.PAUSED, GameState.GAME_OVER, GameState.GAME_COMPLETED})
+# Menu screens whose GIF background advances each frame
+MENU_ANIMATION_STATES = frozenset({
+    GameState.NAME_INPUT, GameState.MAIN_MENU, GameState.OPTIONS_MENU, GameState.DIFFICULTY_SELECT,
+    GameState.LEVEL_SELECT, GameState.CHANGE_NAME, GameState.WELCOME,
+})
+# States drawn over the menu background: everything but the in-game screens
+MENU_BACKGROUND_STATES = MENU_ANIMATION_STATES | {GameState.GAME_COMPLETED}
+# Menu screens that show the game title; the options menu has its own
+MENU_TITLE_STATES = MENU_BACKGROUND_STATES - {GameState.OPTIONS_MENU}
+
+# Grid step for each arrow key, shared rather than built per key press
+DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = (0, -1), (0, 1), (-1, 0), (1, 0)
+KEY_DIRECTIONS = {pygame.K_UP: DIR_UP, pygame.K_DOWN: DIR_DOWN, pygame.K_LEFT: DIR_LEFT, pygame.K_RIGHT: DIR_RIGHT}
+
+# The only event types the game reacts to; SDL drops everything else before it reaches the queue.
+# TEXTINPUT stays allowed since pygame fills KEYDOWN's unicode from it.
+HANDLED_EVENT_TYPES = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+)
+
 
 class GameController:
     def __init__(self):
         # Initialize Difficulty
         self.difficulty = DEFAULT_DIFFICULTY
-        self.current_difficulty_settings = DIFFICULTY_SETTINGS[self.difficulty]
+        self._apply_difficulty_settings(self.difficulty)
         self.selected_difficulty_for_level_select = None 
 
         # Initialize screen dimensions
@@ -36,7 +63,12 @@ class GameController:
 
         # Initialize pygame screen
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # fblits skips per-item result rects; fall back to blits on pygame builds without it
+        self._screen_fblits = getattr(self.screen, "fblits", self.screen.blits)
         pygame.display.set_caption("Snake Game")
+        # Key releases, wheel, focus and window events are never handled; keep them out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
 
         # Define HUD rectangle
         self.hud_area_rect = pygame.Rect(
@@ -48,6 +80,15 @@ class GameController:
 
         # Initialize game state and components
         self.clock = pygame.time.Clock()
+        self._dirty_rects: List[pygame.Rect] = []
+        # Tick count read once per frame in run(); handlers use it instead of calling get_ticks again
+        self._frame_now = pygame.time.get_ticks()
+        self._full_present_pending = True # Next frame must be presented in full
+        # Frames left in which hover is refreshed even without mouse motion; a new state
+        # needs two since some states only build their button lists while drawing
+        self._hover_refresh_frames = 2
+        self.sound_manager = get_sound_manager()
+        self._asset_prefetch_started = False
         self.game_state = GameState.NAME_INPUT
         self.player_db = PlayerDatabase()
         self.level_manager = LevelManager(LEVEL_CONFIG)
@@ -59,14 +100,12 @@ class GameController:
 
         # Initialize timers that might be accessed by setup/reset methods
         self.last_wall_change_time = 0
-        self.last_apple_spawn_time = {}
         self.state_transition_time = 0
         self.welcome_duration = 2000  # 2 seconds
         self.level_transition_duration = 1500 # 1.5 seconds
 
-        # Initialize SCREEN_UPDATE event type *before* _setup_game_instance is called,
-        # because _setup_game_instance calls _update_game_timer which uses it.
-        self.SCREEN_UPDATE = pygame.USEREVENT + 1
+        # Time of the last game logic step; run() steps again once _base_speed_ms has passed
+        self._last_tick = self._frame_now
 
         # Initialize fonts
         try:
@@ -77,15 +116,75 @@ class GameController:
             self.ui_font = load_font("dpcomic.ttf", 35)
         except Exception as e:
             print(f"Error loading fonts: {e}")
-            self.hud_font = pygame.font.SysFont("arial", 24)
-            self.title_font = pygame.font.SysFont("arial", 40)
-            self.score_font = pygame.font.SysFont("arial", 20)
-            self.small_font = pygame.font.SysFont("arial", 16)
-            self.ui_font = pygame.font.SysFont("arial", 30)
+            self.hud_font = CachedFont(pygame.font.SysFont("arial", 24))
+            self.title_font = CachedFont(pygame.font.SysFont("arial", 40))
+            self.score_font = CachedFont(pygame.font.SysFont("arial", 20))
+            self.small_font = CachedFont(pygame.font.SysFont("arial", 16))
+            self.ui_font = CachedFont(pygame.font.SysFont("arial", 30))
+
+        # Build the score digit atlases up front so the first score drawn in a game does not rasterize them
+        for score_color in (COLOR_BRIGHT_SCORE_TEXT, COLOR_SCORE_TEXT):
+            self.score_font.render("0", True, score_color)
+
+        # The menu titles never change, so they are rendered and placed once
+        self._title_surf = self.title_font.render("SNAKE GAME", True, COLOR_WHITE)
+        self._title_rect = self._title_surf.get_rect(center=(self.screen_width // 2, 80))
+        self._options_title_surf = self.title_font.render("Options", True, COLOR_WHITE)
+        self._options_title_rect = self._options_title_surf.get_rect(center=(self.screen_width // 2, 100))
+        # Reused drawing surfaces: the game area (sized on first draw) and the dimming overlay
+        self._game_area_surface: Optional[pygame.Surface] = None
+        # Level background with the walls drawn on; cleared whenever either of them changes
+        self._scenery_surface: Optional[pygame.Surface] = None
+        self._dim_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self._dim_overlay.fill((0, 0, 0, 180))
+        # HUD background, labels and icon, rebuilt only when a value they show changes
+        self._hud_base: Optional[pygame.Surface] = None
+        self._hud_base_key: Optional[Tuple[Any, ...]] = None
+        self._hud_score_pos = (0, 0)
 
         # Initialize UI elements (needs fonts, screen_width, screen_height)
         self._initialize_ui_elements()
 
+        # Hoverable widgets per state as flat tuples; level select keeps its own list since
+        # its buttons are rebuilt when the screen is entered
+        self._hover_buttons_by_state = {
+            GameState.NAME_INPUT: (self.name_confirm_button, self.prev_color_button_name_input, self.next_color_button_name_input),
+            GameState.MAIN_MENU: (self.play_button, self.options_button, self.quit_button),
+            GameState.CHANGE_NAME: (self.submit_new_name_button, self.cancel_name_change_button),
+            GameState.OPTIONS_MENU: (*self.difficulty_buttons.values(), self.volume_slider, self.change_name_button,
+                                     *self.options_color_buttons.values(), self.options_back_button),
+            GameState.PAUSED: (self.resume_button, self.paused_main_menu_button),
+            GameState.GAME_OVER: (self.retry_button, self.game_over_main_menu_button),
+            GameState.GAME_COMPLETED: (self.main_menu_return_button,),
+            GameState.LEVEL_TRANSITION: (self.next_level_button, self.main_menu_return_button),
+        }
+
+        # Per-state handlers, looked up once per frame or event instead of walking an if/elif chain
+        self._event_handlers = {
+            GameState.NAME_INPUT: self._handle_name_input_events,
+            GameState.MAIN_MENU: self._handle_main_menu_events,
+            GameState.OPTIONS_MENU: self._handle_options_menu_events,
+            GameState.CHANGE_NAME: self._handle_change_name_events,
+            GameState.LEVEL_SELECT: self._handle_level_select_events,
+            GameState.PLAYING: self._handle_playing_events,
+            GameState.PAUSED: self._handle_paused_events,
+            GameState.LEVEL_TRANSITION: self._handle_level_transition_events,
+            GameState.GAME_OVER: self._handle_game_over_events,
+        }
+        self._draw_handlers = {
+            GameState.NAME_INPUT: self._draw_name_input_state,
+            GameState.WELCOME: self._draw_welcome_state,
+            GameState.MAIN_MENU: self._draw_main_menu_state,
+            GameState.OPTIONS_MENU: self._draw_options_menu,
+            GameState.CHANGE_NAME: self._draw_change_name_state,
+            GameState.LEVEL_SELECT: self._draw_level_select_state,
+            GameState.PLAYING: self._draw_playing_state,
+            GameState.PAUSED: self._draw_paused_state,
+            GameState.LEVEL_TRANSITION: self._draw_level_transition_state,
+            GameState.GAME_OVER: self._draw_game_over_state,
+            GameState.GAME_COMPLETED: self._draw_game_completed_state,
+        }
+
         # Initialize game elements, cell_size, game_area_rect etc.
         # This also sets self.cell_number based on current_difficulty_settings
         self._setup_game_instance() # This will also set self.score = 0
@@ -97,14 +196,17 @@ class GameController:
                                                 scale=(self.screen_width, self.screen_height))
         except Exception as e: # General exception for GIF loading
             print(f"Error loading main menu GIF: {e}")
-            placeholder = pygame.Surface((self.screen_width, self.screen_height))
+            placeholder = pygame.Surface((self.screen_width, self.screen_height)).convert()
             placeholder.fill(COLOR_DARK_GREEN)
             self.main_menu_frames = [placeholder]
+        # Frames are already converted to the display format; a tuple and its length are all the loop needs
+        self.main_menu_frames = tuple(self.main_menu_frames)
+        self._menu_frame_count = len(self.main_menu_frames)
 
         # Initialize sound
-        sound_manager.set_volume(self.volume)
+        self.sound_manager.set_volume(self.volume)
         # Start background music
-        sound_manager.play_music()
+        self.sound_manager.play_music()
 
     def _calculate_dynamic_dimensions(self):
         """
@@ -150,15 +252,17 @@ class GameController:
 
     def _setup_game_instance(self):
         """Initializes or re-initializes game objects based on current difficulty."""
-        self.cell_number = self.current_difficulty_settings["cell_number"]
+        self.cell_number = self.current_difficulty_settings.cell_number
         
         self._calculate_dynamic_dimensions() 
 
         self.world_tileset = get_tileset("world_tileset.png", 16, 16, self.cell_size)
         self.apple_sprites = load_apple_sprites(self.cell_size)
         self.apple_score_icon = None
-        if hasattr(self, 'score_font') and self.score_font and "good" in self.apple_sprites:
-             self.apple_score_icon = pygame.transform.scale(self.apple_sprites["good"], (self.score_font.get_height(), self.score_font.get_height()))
+        if hasattr(self, 'score_font') and self.score_font and self.apple_sprites:
+             # Cached per cell size and icon size, so replays at the same difficulty skip the rescale
+             icon_size = self.score_font.get_height()
+             self.apple_score_icon = load_scaled_apple_sprites(self.cell_size, (icon_size, icon_size))[AppleState.GOOD]
         else:
             print("Warning: score_font or apple_sprites not ready for apple_score_icon in _setup_game_instance")
             self.apple_score_icon = None
@@ -166,11 +270,20 @@ class GameController:
 
         self.background = Background(self.cell_size, self.cell_number)
 
-        initial_snake_pos = Vector2(self.cell_number // 4, self.cell_number // 2)
+        initial_snake_pos = (self.cell_number // 4, self.cell_number // 2)
         self.snake = Snake(self.cell_size, self.cell_number, initial_pos=initial_snake_pos, color=self.snake_color)
         
-        self.apples = []
+        # Apples come from a pool sized for the busiest level; self.apples lists every slot, active or not
+        self.fruit_pool = FruitPool(self.cell_size, self.cell_number, self.current_difficulty_settings,
+                                    self.level_manager.get_max_apples())
+        self.apples = self.fruit_pool.fruits
         self.wall = Wall(self.cell_size, self.cell_number)
+        # Grid cells not covered by the snake, a wall or an active apple; apples spawn from here
+        self._free_cells = FreeCells()
+        # Active apples by the cell they sit on, kept in step with apple spawns and despawns
+        self._apple_by_pos: Dict[Tuple[int, int], Fruit] = {}
+        # Tick times at which despawned apples come back, soonest first
+        self._apple_respawn_heap: List[int] = []
 
         self.score = 0
         self._reset_level_state()
@@ -260,6 +373,25 @@ class GameController:
             action=lambda: self._go_to_change_name()
         )
 
+        # Change name screen input and buttons
+        name_button_width, name_button_height, name_button_spacing = 200, 50, 20
+        self.new_name_input = TextInput(
+            center_x - 150, center_y - 25,
+            300, 50, self.ui_font
+        )
+
+        self.submit_new_name_button = Button(
+            center_x - name_button_width - name_button_spacing // 2, center_y + 50,
+            name_button_width, name_button_height, "Submit", self.ui_font,
+            action=self._try_update_player_name
+        )
+
+        self.cancel_name_change_button = Button(
+            center_x + name_button_spacing // 2, center_y + 50,
+            name_button_width, name_button_height, "Cancel", self.ui_font,
+            action=partial(self._change_state, GameState.OPTIONS_MENU)
+        )
+
         # Back buttons for various menus
         self.options_back_button = Button(
             50, self.screen_height - 70,
@@ -275,6 +407,12 @@ class GameController:
         # Keep track of the difficulty for which buttons were last generated
         self._last_difficulty_for_level_buttons: Optional[str] = None
         self._last_player_id_for_level_buttons: Optional[int] = None
+        self._last_unlocked_level_for_level_buttons: Optional[int] = None
+        # Buttons shown on the level select screen and their rects, in matching order,
+        # so one collidelist call finds the button under the cursor
+        self._level_select_buttons: List[Button] = []
+        self._level_select_rects: List[pygame.Rect] = []
+        self._point_rect = pygame.Rect(0, 0, 1, 1)
 
         self.level_select_back_button = Button(
             50, self.screen_height - 70,
@@ -347,42 +485,48 @@ class GameController:
             )
             self.options_color_buttons[color_name] = btn
 
+        # Snake color the options color buttons are currently styled for
+        self._options_highlighted_color: Optional[str] = None
+
+        # Options menu click targets as (rect, button, plays menu sound); color buttons play their own
+        self._options_btn_rects: Tuple[Tuple[pygame.Rect, Button, bool], ...] = (
+            *((button.rect, button, True) for button in self.difficulty_buttons.values()),
+            (self.change_name_button.rect, self.change_name_button, True),
+            *((button.rect, button, False) for button in self.options_color_buttons.values()),
+            (self.options_back_button.rect, self.options_back_button, True),
+        )
+
     def _set_volume(self, volume: float):
         """Set volume for all game sounds"""
         self.volume = volume
-        sound_manager.set_volume(volume)
+        self.sound_manager.set_volume(volume)
         if self.player_id:
             self.player_db.update_player_volume(self.player_id, volume)
             
-    def _handle_options_menu_events(self, event: pygame.event.Event):
-        # Handle difficulty button clicks
-        for difficulty, button in self.difficulty_buttons.items():
-            if button.handle_event(event):
-                sound_manager.play_sound("menu_button")
-                return True
-
-        # Handle volume slider
+    def _handle_options_menu_events(self, event: pygame.event.Event) -> bool:
+        # The slider tracks drags and releases, so it sees every event
         if self.volume_slider.handle_event(event):
             return True
 
-        # Handle change name button
-        if self.change_name_button.handle_event(event):
-            sound_manager.play_sound("menu_button")
-            return True
-
-        # Handle snake color buttons
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            for color_name, button in self.options_color_buttons.items():
-                if button.handle_event(event):
-                    # _select_snake_color will play sound and update DB
-                    return
-        if self.options_back_button.handle_event(event): 
-            sound_manager.play_sound("menu_button")
-            return
+        # Buttons only react to left clicks; find the one under the cursor, if any
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
+        for rect, button, plays_sound in self._options_btn_rects:
+            if rect.collidepoint(event.pos):
+                if button.handle_event(event) and plays_sound:
+                    self.sound_manager.play_menu_button()
+                return True
         return False
 
+    def _apply_difficulty_settings(self, difficulty: str):
+        """Switch to a difficulty's settings and cache its tick and wall change intervals."""
+        self.current_difficulty_settings = DIFFICULTY_SETTINGS[difficulty]
+        self._base_speed_ms = int(self.current_difficulty_settings.base_speed)
+        self._wall_change_interval_ms = 10000 * self.current_difficulty_settings.obstacle_speed_factor # Base 10s, adjusted
+
     def _update_game_timer(self):
-        pygame.time.set_timer(self.SCREEN_UPDATE, int(self.current_difficulty_settings["base_speed"]))
+        """Restarts the game tick interval from the current frame."""
+        self._last_tick = self._frame_now
 
     def _change_state(self, new_state: GameState):
         """Handle transitions between game states with appropriate sounds"""
@@ -390,29 +534,33 @@ class GameController:
         
         print(f"Changing state from {self.game_state} to {new_state}")
         self.game_state = new_state
-        self.state_transition_time = pygame.time.get_ticks()
+        self.state_transition_time = self._frame_now
+        self._full_present_pending = True
+        self._hover_refresh_frames = 2
         
         # Play appropriate transition sound
         self._play_transition_sound(old_state, new_state)
         
         # Special state handling
         if new_state == GameState.PLAYING:
+            self._update_game_timer()
             if self.snake: 
-                self.snake.direction = Vector2(1, 0) 
-            self.last_wall_change_time = pygame.time.get_ticks()
+                self.snake.direction = DIR_RIGHT
+            self.last_wall_change_time = self._frame_now
             
         elif new_state == GameState.MAIN_MENU:
             # No full reset if coming from options or game over, just ensure music/timers are right for menu
-            pass
+            if not self._asset_prefetch_started:
+                # Warm sheets and sound effects while the player is still in the menus
+                self._asset_prefetch_started = True
+                start_asset_prefetch()
         elif new_state == GameState.NAME_INPUT:
             self.name_input.set_text("") # Clear input field
         elif new_state == GameState.CHANGE_NAME:
             current_name = self.player_db.get_player_data(self.player_id)["name"] if self.player_id else ""
             self.new_name_input.set_text(current_name)
         elif new_state == GameState.LEVEL_SELECT:
-            if self.selected_difficulty_for_level_select and \
-               self.selected_difficulty_for_level_select in self.level_buttons:
-                del self.level_buttons[self.selected_difficulty_for_level_select]
+            self._enter_level_select()
 
 
     def _reset_level_state(self):
@@ -420,21 +568,32 @@ class GameController:
         if self.snake: self.snake.reset()
         
         # Apples
-        self.apples.clear()
-        self.last_apple_spawn_time.clear()
+        self.fruit_pool.release_all()
+        self._apple_by_pos.clear()
+        self._apple_respawn_heap.clear()
+        self._rebuild_free_cells()
         self._spawn_initial_apples()
 
         # Walls
         if self.wall:
             num_obstacles = self.level_manager.get_num_obstacles()
-            apple_current_positions = [apple.pos for apple in self.apples if apple.is_active]
-            self.wall.generate(num_obstacles, self.snake.body if self.snake else [], apple_current_positions)
+            self.wall.generate(num_obstacles, self.snake.body if self.snake else [], self._apple_by_pos.keys())
+            self._rebuild_free_cells()
         
         if self.background:
             self.background.set_level_background(self.level_manager.get_level_number())
+        self._scenery_surface = None
 
-        self.last_wall_change_time = pygame.time.get_ticks()
-        if self.snake: self.snake.direction = Vector2(0,0)
+        self.last_wall_change_time = self._frame_now
+        if self.snake: self.snake.direction = (0, 0)
+
+    def _rebuild_free_cells(self):
+        """Recomputes the free cell set from scratch; used when walls or the whole level change."""
+        free_cells = {(x, y) for x in range(self.cell_number) for y in range(self.cell_number)}
+        if self.snake: free_cells.difference_update(self.snake.body)
+        if self.wall: free_cells.difference_update(self.wall.positions)
+        free_cells.difference_update(self._apple_by_pos)
+        self._free_cells = FreeCells(free_cells)
 
     def _full_game_reset(self, reset_player_too=False, keep_current_level_index=False):
         """Resets the entire game state for a new game (e.g., after game over and play again)."""
@@ -448,7 +607,7 @@ class GameController:
         if keep_current_level_index:
             self.level_manager.current_level_index = current_level_idx
             
-        self.current_difficulty_settings = DIFFICULTY_SETTINGS[self.difficulty]
+        self._apply_difficulty_settings(self.difficulty)
         
         self._setup_game_instance() 
 
@@ -471,16 +630,15 @@ class GameController:
                 self.player_db.unlock_next_level(self.player_id, self.difficulty, completed_level_number)
             self._reset_level_state() 
             if self.background: self.background.set_level_background(self.level_manager.get_level_number())
+            self._scenery_surface = None
             self._change_state(GameState.PLAYING)
         else: 
-            if self.player_id is not None: 
-                self.player_db.unlock_next_level(self.player_id, self.difficulty, completed_level_number) # Unlock final level if structure allows
-            self._trigger_game_completed()
+            self._trigger_game_completed() # Also unlocks the final level if structure allows
 
     def _select_difficulty(self, difficulty: str):
         """Set the difficulty without changing the state - just update UI and settings"""
         self.difficulty = difficulty
-        self.current_difficulty_settings = DIFFICULTY_SETTINGS[difficulty]
+        self._apply_difficulty_settings(difficulty)
         
         for diff, button in self.difficulty_buttons.items():
             if diff == self.difficulty:
@@ -493,7 +651,7 @@ class GameController:
         if self.player_id:
             self.player_db.update_player_difficulty(self.player_id, difficulty)
             
-        sound_manager.play_sound("menu_button")
+        self.sound_manager.play_menu_button()
 
     def _start_level(self, level_index: int):
         if self.selected_difficulty_for_level_select is None:
@@ -501,7 +659,7 @@ class GameController:
             return
 
         self.difficulty = self.selected_difficulty_for_level_select
-        self.current_difficulty_settings = DIFFICULTY_SETTINGS[self.difficulty]
+        self._apply_difficulty_settings(self.difficulty)
         
         self.level_manager.set_difficulty(self.difficulty)
         
@@ -512,123 +670,132 @@ class GameController:
         self._change_state(GameState.PLAYING)
 
     def run(self):
-        while self.game_state != GameState.QUITTING:
-            current_time = pygame.time.get_ticks()
-            mouse_pos = pygame.mouse.get_pos()
+        # Bind the per-frame calls to locals once instead of looking them up every frame
+        get_ticks = pygame.time.get_ticks
+        get_mouse = pygame.mouse.get_pos
+        get_events = pygame.event.get
+        wait_event = pygame.event.wait
+        tick = self.clock.tick
+        handle = self._handle_current_state_events
+        update_logic = self._update_current_state_logic
+        update_hover = self._update_hover_states
+        draw = self._draw_current_state
+        flip = pygame.display.flip
+        update_display = pygame.display.update
+        dirty_rects = self._dirty_rects
+        QUIT = pygame.QUIT
+        NOEVENT = pygame.NOEVENT
+        MOUSEMOTION = pygame.MOUSEMOTION
+        QUITTING = GameState.QUITTING
+        expose_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+        waited_event = None # Event that ended an idle wait; handled first in the next frame
+
+        while self.game_state != QUITTING:
+            current_time = self._frame_now = get_ticks()
+            mouse_pos = get_mouse()
             
-            events = pygame.event.get()
+            events = get_events()
+            if waited_event is not None:
+                events.insert(0, waited_event)
+                waited_event = None
+            mouse_moved = False
             for event in events:
-                if event.type == pygame.QUIT:
-                    self._change_state(GameState.QUITTING)
+                if event.type == MOUSEMOTION:
+                    mouse_moved = True
+                if event.type == QUIT:
+                    self._change_state(QUITTING)
                     break
-                self._handle_current_state_events(event)
-            if self.game_state == GameState.QUITTING: break
-
-            self._update_current_state_logic(current_time)
-            self._update_hover_states(mouse_pos)
-            self._draw_current_state(current_time)
-
-            pygame.display.flip()
-            self.clock.tick(60) 
+                if event.type in expose_events:
+                    self._full_present_pending = True
+                handle(event)
+            if self.game_state == QUITTING: break
+
+            update_logic(current_time)
+            # Hover only changes when the mouse moves or the buttons on screen change
+            if mouse_moved or self._hover_refresh_frames:
+                if self._hover_refresh_frames:
+                    self._hover_refresh_frames -= 1
+                update_hover(mouse_pos)
+            draw(current_time)
+
+            if self.game_state in STATIC_PRESENT_STATES:
+                if self._full_present_pending:
+                    flip()
+                    self._full_present_pending = False
+                elif dirty_rects:
+                    # Only the buttons whose hover changed differ from what is already on screen
+                    update_display(dirty_rects)
+                dirty_rects.clear()
+                # Nothing animates here, so sleep until input arrives instead of spinning frames
+                waited_event = wait_event(STATIC_WAIT_MS)
+                if waited_event.type == NOEVENT:
+                    waited_event = None
+            else:
+                flip()
+                self._full_present_pending = False
+                dirty_rects.clear()
+                tick(FPS)
 
+        self.player_db.close()
         pygame.quit()
         sys.exit()
 
     def _handle_current_state_events(self, event):
-        # Universal key presses
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE and self.game_state == GameState.PLAYING:
-                self._change_state(GameState.PAUSED)
-                return 
+        handler = self._event_handlers.get(self.game_state)
+        if handler:
+            handler(event)
+
+    def _handle_menu_buttons(self, event, buttons) -> bool:
+        """Passes a left click to each button in turn; plays the menu sound for the one that acts."""
+        # Buttons ignore everything but left clicks, so other events skip the walk entirely
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
+        for button in buttons:
+            if button.handle_event(event):
+                self.sound_manager.play_menu_button()
+                return True
+        return False
 
-        # State-specific event handling
-        if self.game_state == GameState.NAME_INPUT:
-            if self.name_input.handle_event(event): 
-                # If enter is pressed in text input, consider it a confirm
-                self._handle_name_confirmation()
-                return
-            if self.name_confirm_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                # _handle_name_confirmation is called by button's action
-                return
-            if self.prev_color_button_name_input.handle_event(event):
-                # Action handles sound and logic
-                return
-            if self.next_color_button_name_input.handle_event(event):
-                # Action handles sound and logic
-                return
-        elif self.game_state == GameState.MAIN_MENU:
-            if self.play_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-            if self.options_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-            if self.quit_button.handle_event(event):
-                sound_manager.play_sound("menu_button")
-                return
-        elif self.game_state == GameState.OPTIONS_MENU:
-            # Handle difficulty buttons
-            for button in self.difficulty_buttons.values():
-                if button.handle_event(event):
-                    sound_manager.play_sound("menu_button")
-                    return
-            # Handle volume slider
-            if self.volume_slider.handle_event(event):
-                return
-            # Handle change name button
-            if self.change_name_button.handle_event(event):
-                sound_manager.play_sound("menu_button")
-                return
-            # Handle snake color buttons
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for color_name, button in self.options_color_buttons.items():
-                    if button.handle_event(event):
-                        return
-            if self.options_back_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-        elif self.game_state == GameState.CHANGE_NAME:
-            if self.new_name_input.handle_event(event):
-                self._try_update_player_name()
-                return
-            if self.submit_new_name_button.handle_event(event):
-                sound_manager.play_sound("menu_button")
-                return
-            if self.cancel_name_change_button.handle_event(event):
-                sound_manager.play_sound("menu_button")
-                return
-        elif self.game_state == GameState.LEVEL_SELECT:
-            if hasattr(self, 'current_buttons'):
-                for button in self.current_buttons:
-                    if button and hasattr(button, 'handle_event') and button.handle_event(event):
-                        sound_manager.play_sound("menu_button")
-                        return
-        elif self.game_state == GameState.PLAYING:
-            self._handle_playing_events(event) 
-        elif self.game_state == GameState.PAUSED:
-            if self.resume_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-            if self.paused_main_menu_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-        elif self.game_state == GameState.LEVEL_TRANSITION:
-            if pygame.time.get_ticks() - self.state_transition_time > self.level_transition_duration:
-                if self.next_level_button.handle_event(event): 
-                    sound_manager.play_sound("menu_button")
-                    return
-                if self.main_menu_return_button.handle_event(event): 
-                    sound_manager.play_sound("menu_button")
-                    return
-        elif self.game_state == GameState.GAME_OVER:
-            if self.retry_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
-            if self.game_over_main_menu_button.handle_event(event): 
-                sound_manager.play_sound("menu_button")
-                return
+    def _handle_name_input_events(self, event):
+        if self.name_input.handle_event(event): 
+            # If enter is pressed in text input, consider it a confirm
+            self._handle_name_confirmation()
+            return
+        if self.name_confirm_button.handle_event(event): 
+            self.sound_manager.play_menu_button()
+            # _handle_name_confirmation is called by button's action
+            return
+        # The color buttons' actions handle sound and logic
+        if self.prev_color_button_name_input.handle_event(event):
+            return
+        self.next_color_button_name_input.handle_event(event)
+
+    # The menu handlers reuse the per-state hover tuples, which list the same buttons
+    def _handle_main_menu_events(self, event):
+        self._handle_menu_buttons(event, self._hover_buttons_by_state[GameState.MAIN_MENU])
+
+    def _handle_change_name_events(self, event):
+        if self.new_name_input.handle_event(event):
+            self._try_update_player_name()
+            return
+        self._handle_menu_buttons(event, self._hover_buttons_by_state[GameState.CHANGE_NAME])
+
+    def _handle_level_select_events(self, event):
+        # Buttons only react to left clicks, and only the one under the cursor can
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self._level_select_hit(event.pos)
+            if index >= 0 and self._level_select_buttons[index].handle_event(event):
+                self.sound_manager.play_menu_button()
+
+    def _handle_paused_events(self, event):
+        self._handle_menu_buttons(event, self._hover_buttons_by_state[GameState.PAUSED])
+
+    def _handle_level_transition_events(self, event):
+        if self._frame_now - self.state_transition_time > self.level_transition_duration:
+            self._handle_menu_buttons(event, self._hover_buttons_by_state[GameState.LEVEL_TRANSITION])
 
+    def _handle_game_over_events(self, event):
+        self._handle_menu_buttons(event, self._hover_buttons_by_state[GameState.GAME_OVER])
 
     def _update_current_state_logic(self, current_time: int):
         if self.game_state == GameState.NAME_INPUT:
@@ -639,102 +806,84 @@ class GameController:
             if current_time - self.state_transition_time > self.welcome_duration:
                 self._change_state(GameState.MAIN_MENU)
         elif self.game_state == GameState.PLAYING:
-            for apple in self.apples:
-                if apple.is_active:
-                    apple.update_state(current_time)
-                    if apple.state == AppleState.EXPIRED:
-                        self._handle_apple_despawn(apple)
+            # Step the game directly from the frame clock instead of a queued timer event. Steps
+            # missed during a slow frame are made up, but only up to MAX_CATCHUP_STEPS at once;
+            # beyond that the backlog is dropped rather than letting it snowball
+            steps = 0
+            while current_time - self._last_tick >= self._base_speed_ms and self.game_state == GameState.PLAYING:
+                if steps == MAX_CATCHUP_STEPS:
+                    self._last_tick = current_time
+                    break
+                self._last_tick += self._base_speed_ms
+                self._update_game_logic()
+                steps += 1
+            if self.game_state == GameState.PLAYING: # The step may have ended the level
+                for apple in self.apples:
+                    # Apples only change state at their scheduled time
+                    if apple.is_active and current_time >= apple.next_update_time:
+                        apple.update_state(current_time)
+                        if apple.state == AppleState.EXPIRED:
+                            self._handle_apple_despawn(apple)
+                # Bring back apples whose spawn delay has run out
+                respawn_heap = self._apple_respawn_heap
+                while respawn_heap and respawn_heap[0] <= current_time:
+                    heapq.heappop(respawn_heap)
+                    if self.fruit_pool.active_count() < self.level_manager.get_num_apples():
+                        self._spawn_apple()
         
         # Animate menu background
-        menu_states_for_gif_update = [
-            GameState.NAME_INPUT, GameState.MAIN_MENU, 
-            GameState.OPTIONS_MENU, GameState.DIFFICULTY_SELECT, 
-            GameState.LEVEL_SELECT,
-            GameState.CHANGE_NAME, GameState.WELCOME
-        ]
-        if self.game_state in menu_states_for_gif_update:
-            self.current_menu_frame_index = (self.current_menu_frame_index + 1) % len(self.main_menu_frames)
+        if self.game_state in MENU_ANIMATION_STATES:
+            self.current_menu_frame_index = (self.current_menu_frame_index + 1) % self._menu_frame_count
 
 
     def _update_hover_states(self, mouse_pos):
         """Update button hover states based on mouse position"""
-        # Update hover states for buttons based on the current state
-        if self.game_state == GameState.NAME_INPUT:
-            self.name_confirm_button.check_hover(mouse_pos)
-            self.prev_color_button_name_input.check_hover(mouse_pos)
-            self.next_color_button_name_input.check_hover(mouse_pos)
-        elif self.game_state == GameState.MAIN_MENU:
-            self.play_button.check_hover(mouse_pos)
-            self.options_button.check_hover(mouse_pos)
-            self.quit_button.check_hover(mouse_pos)
-        elif self.game_state == GameState.OPTIONS_MENU:
-            for button in self.difficulty_buttons.values():
-                button.check_hover(mouse_pos)
-            self.volume_slider.check_hover(mouse_pos)
-            self.change_name_button.check_hover(mouse_pos)
-            for button in self.options_color_buttons.values():
+        state = self.game_state
+        if state == GameState.LEVEL_SELECT:
+            hovered = self._level_select_hit(mouse_pos)
+            for index, button in enumerate(self._level_select_buttons):
+                button.is_hovered = index == hovered
+        elif state in STATIC_PRESENT_STATES:
+            # These screens are presented by dirty rects, so changed buttons must be marked
+            for button in self._hover_buttons_by_state[state]:
+                self._check_hover_dirty(button, mouse_pos)
+        elif state == GameState.LEVEL_TRANSITION and self._frame_now - self.state_transition_time <= self.level_transition_duration:
+            # The buttons have not appeared yet; check again once they do
+            self._hover_refresh_frames = 2
+        else:
+            for button in self._hover_buttons_by_state.get(state, ()):
                 button.check_hover(mouse_pos)
-            self.options_back_button.check_hover(mouse_pos)
-        elif self.game_state == GameState.CHANGE_NAME:
-            # TextInput objects don't have check_hover method
-            self.submit_new_name_button.check_hover(mouse_pos)
-            self.cancel_name_change_button.check_hover(mouse_pos)
-        elif self.game_state == GameState.LEVEL_SELECT:
-            # Update hover for all active buttons
-            if hasattr(self, 'current_buttons'):
-                for button in self.current_buttons:
-                    if button and hasattr(button, 'check_hover'):
-                        button.check_hover(mouse_pos)
-        elif self.game_state == GameState.PAUSED:
-            self.resume_button.check_hover(mouse_pos)
-            self.paused_main_menu_button.check_hover(mouse_pos)
-        elif self.game_state == GameState.GAME_OVER:
-            self.retry_button.check_hover(mouse_pos)
-            self.game_over_main_menu_button.check_hover(mouse_pos) # Corrected button
-        elif self.game_state == GameState.LEVEL_TRANSITION:
-            if pygame.time.get_ticks() - self.state_transition_time > self.level_transition_duration:
-                self.next_level_button.check_hover(mouse_pos)
-                self.main_menu_return_button.check_hover(mouse_pos)
+
+    def _level_select_hit(self, pos) -> int:
+        """Index of the level select button under pos, or -1 if there is none."""
+        self._point_rect.topleft = pos
+        return self._point_rect.collidelist(self._level_select_rects)
+
+    def _set_level_select_buttons(self, buttons: List[Button]):
+        self._level_select_buttons = buttons
+        self._level_select_rects = [button.rect for button in buttons]
+
+    def _check_hover_dirty(self, button: Button, mouse_pos):
+        """Updates a button's hover state and marks its rect for presenting if it changed."""
+        if button.check_hover(mouse_pos):
+            self._dirty_rects.append(button.rect.copy())
 
     # --- State Drawing ---
     def _draw_current_state(self, current_time: int):
         """Draw the current game state"""
-        # First, draw the base background for all states
-        if hasattr(self, 'main_menu_frames') and self.main_menu_frames and self.game_state not in [GameState.PLAYING, GameState.PAUSED, GameState.GAME_OVER, GameState.LEVEL_TRANSITION]:
+        # First, draw the base background for all states, with the title on menu screens
+        if self.game_state in MENU_BACKGROUND_STATES:
             # Animated menu background for main menu and related states
             self.screen.blit(self.main_menu_frames[self.current_menu_frame_index], (0, 0))
+            if self.game_state in MENU_TITLE_STATES:
+                self.screen.blit(self._title_surf, self._title_rect)
         else:
             self.screen.fill(COLOR_DARK_GREEN)
 
-        # Draw title text for all non-playing states
-        if self.game_state != GameState.PLAYING and self.game_state != GameState.PAUSED and self.game_state != GameState.LEVEL_TRANSITION and self.game_state != GameState.GAME_OVER:
-            title_surf = self.title_font.render("SNAKE GAME", True, COLOR_WHITE)
-            title_rect = title_surf.get_rect(center=(self.screen_width // 2, 80))
-            self.screen.blit(title_surf, title_rect)
-
         # Draw state-specific content
-        if self.game_state == GameState.NAME_INPUT:
-            self._draw_name_input_state()
-        elif self.game_state == GameState.WELCOME:
-            self._draw_welcome_state()
-        elif self.game_state == GameState.MAIN_MENU:
-            self._draw_main_menu_state()
-        elif self.game_state == GameState.OPTIONS_MENU:
-            self._draw_options_menu()
-        elif self.game_state == GameState.CHANGE_NAME:
-            self._draw_change_name_state()
-        elif self.game_state == GameState.LEVEL_SELECT:
-            self._draw_level_select_state()
-        elif self.game_state == GameState.PLAYING:
-            self._draw_playing_state()
-        elif self.game_state == GameState.PAUSED:
-            self._draw_paused_state()
-        elif self.game_state == GameState.LEVEL_TRANSITION:
-            self._draw_level_transition_state(current_time)
-        elif self.game_state == GameState.GAME_OVER:
-            self._draw_game_over_state()
-        elif self.game_state == GameState.GAME_COMPLETED:
-            self._draw_game_completed_state()
+        handler = self._draw_handlers.get(self.game_state)
+        if handler:
+            handler()
 
 
     def _draw_name_input_state(self):
@@ -746,37 +895,38 @@ class GameController:
         color_label_rect = color_label_surf.get_rect(center=(self.screen_width // 2, self.name_input.rect.bottom + 40)) # Adjusted Y
         self.screen.blit(color_label_surf, color_label_rect)
 
-        # Draw color selection UI
-        self.prev_color_button_name_input.draw(self.screen)
-        self.next_color_button_name_input.draw(self.screen)
-
         # Display current color text
         color_text_surf = self.ui_font.render(self.snake_color.capitalize(), True, COLOR_WHITE)
         color_text_rect = color_text_surf.get_rect(center=(self.screen_width // 2, self.prev_color_button_name_input.rect.centery))
         self.screen.blit(color_text_surf, color_text_rect)
-        
-        self.name_confirm_button.draw(self.screen)
+
+        # Draw color selection UI and the confirm button
+        self._draw_buttons((self.prev_color_button_name_input, self.next_color_button_name_input, self.name_confirm_button))
 
     def _draw_welcome_state(self):
         self._draw_overlay_message(f"Welcome, {self.player_name}!", title_font=self.title_font, y_offset_factor=0.5)
 
     def _draw_main_menu_state(self):
-        self.play_button.draw(self.screen)
-        self.options_button.draw(self.screen)
-        self.quit_button.draw(self.screen)
+        self._draw_buttons((self.play_button, self.options_button, self.quit_button))
         
+    def _highlight_options_color(self):
+        """Restyles the options color buttons so only the selected snake color is highlighted."""
+        for color_name, button in self.options_color_buttons.items():
+            if color_name == self.snake_color:
+                button.color = COLOR_BUTTON_HIGHLIGHT
+                button.hover_color = COLOR_BUTTON_HIGHLIGHT_HOVER
+                button.text_color = COLOR_BLACK
+            else:
+                button.color = COLOR_BUTTON_NORMAL
+                button.hover_color = COLOR_BUTTON_HOVER
+                button.text_color = COLOR_WHITE
+            button._render_text()
+        self._options_highlighted_color = self.snake_color
+
     def _draw_options_menu(self):
         """Draw options menu"""
-        # Draw menu animation or background
-        if hasattr(self, 'main_menu_frames') and self.main_menu_frames:
-            self.screen.blit(self.main_menu_frames[self.current_menu_frame_index], (0, 0))
-        else:
-            self.screen.fill(COLOR_DARK_GREEN)
-
-        # Draw title
-        title_surf = self.title_font.render("Options", True, COLOR_WHITE)
-        title_rect = title_surf.get_rect(center=(self.screen_width // 2, 100))
-        self.screen.blit(title_surf, title_rect)
+        # The menu background is already drawn by _draw_current_state
+        self.screen.blit(self._options_title_surf, self._options_title_rect)
 
         # Draw current difficulty setting
         current_difficulty_surf = self.ui_font.render(
@@ -787,79 +937,63 @@ class GameController:
         )
         self.screen.blit(current_difficulty_surf, current_difficulty_rect)
 
-        # Draw difficulty buttons
-        for button in self.difficulty_buttons.values():
-            button.draw(self.screen)
-
         # Draw volume slider
         self.volume_slider.draw(self.screen)
-        
-        # Draw change name button
-        self.change_name_button.draw(self.screen)
 
         # Draw Snake Color Selection UI
         color_label_surf = self.small_font.render("Snake Color:", True, COLOR_WHITE)
         color_label_rect = color_label_surf.get_rect(center=(self.screen_width // 2, self.change_name_button.rect.bottom + 15))
         self.screen.blit(color_label_surf, color_label_rect)
         
-        for color_name, button in self.options_color_buttons.items():
-            if color_name == self.snake_color:
-                button.color = COLOR_BUTTON_HIGHLIGHT
-                button.hover_color = COLOR_BUTTON_HIGHLIGHT_HOVER
-                button.text_color = COLOR_BLACK
-            else:
-                button.color = COLOR_BUTTON_NORMAL
-                button.hover_color = COLOR_BUTTON_HOVER
-                button.text_color = COLOR_WHITE
-            button._render_text()
-            button.draw(self.screen)
+        if self.snake_color != self._options_highlighted_color:
+            self._highlight_options_color()
 
-        self.options_back_button.draw(self.screen)
+        # Draw difficulty, change name, color and back buttons in one batch
+        self._draw_buttons((*self.difficulty_buttons.values(), self.change_name_button,
+                            *self.options_color_buttons.values(), self.options_back_button))
 
     def _draw_change_name_state(self):
         self._draw_centered_text("Enter New Name:", self.ui_font, COLOR_WHITE, self.screen_width // 2, self.screen_height // 2 - 80)
         self.new_name_input.draw(self.screen)
-        self.submit_new_name_button.draw(self.screen)
-        self.cancel_name_change_button.draw(self.screen)
         self.current_buttons = [self.submit_new_name_button, self.cancel_name_change_button]
+        self._draw_buttons(self.current_buttons)
 
 
     def _draw_difficulty_select_state(self):
         self._draw_centered_text("SELECT DIFFICULTY", self.ui_font, COLOR_WHITE, self.screen_width // 2, int(self.screen_height // 3.8))
-        for btn in self.difficulty_buttons.values(): btn.draw(self.screen)
         self.current_buttons = list(self.difficulty_buttons.values())
+        self._draw_buttons(self.current_buttons)
 
     def _draw_level_select_state(self):
         self._draw_centered_text(f"SELECT LEVEL ({self.selected_difficulty_for_level_select})", 
                                  self.ui_font, COLOR_WHITE, 
                                  self.screen_width // 2, int(self.screen_height // 4.2))
-        
-        self.current_buttons = []
-
         if self.player_id is None or self.selected_difficulty_for_level_select is None:
             self._draw_centered_text("Error: Player or difficulty not set.", self.ui_font, COLOR_RED, self.screen_width // 2, self.screen_height // 2)
-            self.level_select_back_button.draw(self.screen)
-            self.current_buttons.append(self.level_select_back_button)
+        self._draw_buttons(self._level_select_buttons)
+
+    def _enter_level_select(self):
+        """Builds the level buttons for the selected difficulty, reusing them if nothing changed."""
+        if self.player_id is None or self.selected_difficulty_for_level_select is None:
+            self.current_buttons = [self.level_select_back_button]
+            self._set_level_select_buttons(self.current_buttons)
             return
 
         difficulty_key = self.selected_difficulty_for_level_select
+        # Reuse the existing buttons unless a level was unlocked since they were built
+        unlocked_level_for_difficulty = self.player_db.get_unlocked_level(self.player_id, difficulty_key)
 
-        regenerate_buttons = False
         if (difficulty_key not in self.level_buttons or 
             self._last_difficulty_for_level_buttons != difficulty_key or 
-            self._last_player_id_for_level_buttons != self.player_id):
-            regenerate_buttons = True
+            self._last_player_id_for_level_buttons != self.player_id or
+            self._last_unlocked_level_for_level_buttons != unlocked_level_for_difficulty):
             self.level_buttons[difficulty_key] = []
             self._last_difficulty_for_level_buttons = difficulty_key
             self._last_player_id_for_level_buttons = self.player_id
-
-        if regenerate_buttons:
-            unlocked_level_for_difficulty = self.player_db.get_unlocked_level(self.player_id, difficulty_key)
+            self._last_unlocked_level_for_level_buttons = unlocked_level_for_difficulty
             levels_for_current_difficulty = self.level_manager.get_levels_for_difficulty(difficulty_key)
             
             num_levels = len(levels_for_current_difficulty)
-            if num_levels == 0:
-                pass
 
             button_width, button_height = 120, 50
             spacing = 20
@@ -868,11 +1002,11 @@ class GameController:
             button_y = self.screen_height // 2 - button_height // 2
 
             for i, level_data in enumerate(levels_for_current_difficulty):
-                level_num = level_data["level"]
+                level_num = level_data.level
                 is_unlocked = level_num <= unlocked_level_for_difficulty
                 
                 btn_text = f"Lvl {level_num}"
-                action = (lambda lvl_idx=i: self._start_level(lvl_idx)) if is_unlocked else None
+                action = partial(self._start_level, i) if is_unlocked else None
                 
                 button_x_pos = start_x + i * (button_width + spacing)
 
@@ -887,19 +1021,19 @@ class GameController:
                 
                 self.level_buttons[difficulty_key].append(btn)
 
-        for btn in self.level_buttons.get(difficulty_key, []):
-            btn.draw(self.screen)
-            self.current_buttons.append(btn)
-
-        self.level_select_back_button.draw(self.screen)
-        self.current_buttons.append(self.level_select_back_button)
+        self.current_buttons = [*self.level_buttons[difficulty_key], self.level_select_back_button]
+        self._set_level_select_buttons(self.current_buttons)
 
     def _draw_playing_state(self):
-        # Draw game area
-        game_area_surface = pygame.Surface((self.game_surface_width, self.game_surface_height))
+        # Draw game area onto a surface kept between frames; it is only reallocated when the grid size changes
+        game_area_surface = self._game_area_surface
+        if game_area_surface is None or game_area_surface.get_size() != (self.game_surface_width, self.game_surface_height):
+            game_area_surface = self._game_area_surface = pygame.Surface((self.game_surface_width, self.game_surface_height)).convert()
         
-        if self.background: self.background.draw(game_area_surface)
-        if self.wall: self.wall.draw(game_area_surface)
+        # Background and walls only change with the level or a wall shuffle, so they are drawn as one layer
+        if self._scenery_surface is None:
+            self._scenery_surface = self._render_scenery()
+        game_area_surface.blit(self._scenery_surface, (0, 0))
         for apple in self.apples:
             if apple.is_active:
                 apple.draw(game_area_surface)
@@ -914,11 +1048,10 @@ class GameController:
     def _draw_paused_state(self):
         self._draw_playing_state() 
         self._draw_overlay_message("PAUSED", title_font=self.title_font, y_offset_factor=0.3)
-        self.resume_button.draw(self.screen)
-        self.paused_main_menu_button.draw(self.screen)
+        self._draw_buttons((self.resume_button, self.paused_main_menu_button))
 
 
-    def _draw_level_transition_state(self, current_time: int):
+    def _draw_level_transition_state(self):
         self._draw_playing_state()
         title = f"Level {self.level_manager.get_level_number() -1} Complete!" if self.level_manager.current_level_index > 0 else "Get Ready!"
         self._draw_overlay_message(title, title_font=self.title_font, y_offset_factor=0.3)
@@ -928,10 +1061,9 @@ class GameController:
         self._draw_centered_text(f"Next: Level {next_level_num}", self.ui_font, COLOR_WHITE, self.screen_width//2, self.screen_height//2 - 20)
         self._draw_centered_text(f"Target: {next_target} points", self.ui_font, COLOR_WHITE, self.screen_width//2, self.screen_height//2 + 20)
 
-        if current_time - self.state_transition_time > self.level_transition_duration:
-            self.next_level_button.draw(self.screen)
-            self.main_menu_return_button.draw(self.screen)
+        if self._frame_now - self.state_transition_time > self.level_transition_duration:
             self.current_buttons = [self.next_level_button, self.main_menu_return_button]
+            self._draw_buttons(self.current_buttons)
 
 
     def _draw_game_over_state(self):
@@ -939,8 +1071,7 @@ class GameController:
         self._draw_overlay_message("GAME OVER", color=COLOR_RED, title_font=self.title_font, y_offset_factor=0.3)
         self._draw_centered_text(f"Final Score: {self.score}", self.ui_font, COLOR_WHITE, self.screen_width//2, self.screen_height//2 - 20)
         self._draw_centered_text(f"Reached Level: {self.level_manager.get_level_number()}", self.ui_font, COLOR_WHITE, self.screen_width//2, self.screen_height//2 + 20)
-        self.retry_button.draw(self.screen)
-        self.game_over_main_menu_button.draw(self.screen)
+        self._draw_buttons((self.retry_button, self.game_over_main_menu_button))
 
     def _draw_game_completed_state(self):
         self._draw_playing_state()
@@ -950,12 +1081,27 @@ class GameController:
         self.main_menu_return_button.draw(self.screen)
 
     # --- HUD and Drawing Helpers ---
+    def _draw_buttons(self, buttons):
+        """Draws a group of buttons with a single batched blit call."""
+        self._screen_fblits([button.blit_item() for button in buttons])
+
     def _draw_score_hud(self):
+        text_color = COLOR_BRIGHT_SCORE_TEXT if self.game_state == GameState.PLAYING else COLOR_SCORE_TEXT
+        level_cfg = self.level_manager.get_current_level_config()
+        hud_key = (self.player_name, level_cfg.level, self.difficulty,
+                   level_cfg.target_score, text_color, self.apple_score_icon)
+        if hud_key != self._hud_base_key:
+            self._hud_base, self._hud_score_pos = self._render_hud_base(text_color)
+            self._hud_base_key = hud_key
+        self.screen.blit(self._hud_base, (self.game_area_width, 0))
+        # Only the score changes during play; it goes straight onto the screen over the base
+        self.score_font.blit_text(self.screen, str(self.score), self._hud_score_pos, True, text_color)
+
+    def _render_hud_base(self, text_color: Tuple[int, int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Builds the HUD background, labels and apple icon; returns it with the score's screen position."""
         hud_surface = pygame.Surface((HUD_WIDTH, self.screen_height), pygame.SRCALPHA)
         hud_surface.fill(COLOR_HUD_BG)
 
-        text_color = COLOR_BRIGHT_SCORE_TEXT if self.game_state == GameState.PLAYING else COLOR_SCORE_TEXT
-
         margin = 10
         y_offset = margin
         
@@ -975,18 +1121,16 @@ class GameController:
         hud_surface.blit(target_surf, (margin, y_offset))
         y_offset += target_surf.get_height() + 10
 
-        score_str = str(self.score)
-        score_surf = self.score_font.render(score_str, True, text_color)
+        # Every score renders at the same height, so the icon can be placed without it
+        score_height = self.score_font.render("0", True, text_color).get_height()
         if self.apple_score_icon:
             icon_x = margin
-            icon_y = y_offset + (score_surf.get_height() - self.apple_score_icon.get_height()) // 2
+            icon_y = y_offset + (score_height - self.apple_score_icon.get_height()) // 2
             hud_surface.blit(self.apple_score_icon, (icon_x, icon_y))
             score_x = icon_x + self.apple_score_icon.get_width() + 5
         else:
             score_x = margin
-        hud_surface.blit(score_surf, (score_x, y_offset))
-
-        self.screen.blit(hud_surface, (self.game_area_width, 0))
+        return hud_surface, (self.game_area_width + score_x, y_offset)
 
 
     def _draw_centered_text(self, text: str, font: pygame.font.Font, color: Tuple[int,int,int], center_x: int, center_y: int):
@@ -994,10 +1138,16 @@ class GameController:
         rect = surf.get_rect(center=(center_x, center_y))
         self.screen.blit(surf, rect)
 
+    def _render_scenery(self) -> pygame.Surface:
+        """Draws the level background and walls onto a new game-area sized surface."""
+        scenery = pygame.Surface((self.game_surface_width, self.game_surface_height)).convert()
+        if self.background: self.background.draw(scenery)
+        else: scenery.fill(COLOR_BLACK)
+        if self.wall: self.wall.draw(scenery)
+        return scenery
+
     def _draw_overlay_message(self, message: str, color: Tuple[int,int,int] = COLOR_WHITE, title_font=None, y_offset_factor=0.5):
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0,0))
+        self.screen.blit(self._dim_overlay, (0,0))
         
         font_to_use = title_font if title_font else self.ui_font
         self._draw_centered_text(message, font_to_use, color, self.screen_width // 2, int(self.screen_height * y_offset_factor))
@@ -1018,31 +1168,6 @@ class GameController:
 
     def _go_to_change_name(self):
         """Navigate to the name change screen"""
-        if not hasattr(self, 'new_name_input'):
-            # Create the new name input and buttons if they don't exist yet
-            center_x = self.screen_width // 2
-            center_y = self.screen_height // 2
-            button_width = 200
-            button_height = 50
-            button_spacing = 20
-            
-            self.new_name_input = TextInput(
-                center_x - 150, center_y - 25,
-                300, 50, self.ui_font
-            )
-            
-            self.submit_new_name_button = Button(
-                center_x - button_width - button_spacing // 2, center_y + 50,
-                button_width, button_height, "Submit", self.ui_font,
-                action=lambda: self._try_update_player_name()
-            )
-            
-            self.cancel_name_change_button = Button(
-                center_x + button_spacing // 2, center_y + 50,
-                button_width, button_height, "Cancel", self.ui_font,
-                action=lambda: self._change_state(GameState.OPTIONS_MENU)
-            )
-        
         # Set the current name in the input field
         if self.player_id:
             player_data = self.player_db.get_player_data(self.player_id)
@@ -1060,7 +1185,7 @@ class GameController:
             if success:
                 self.player_name = new_name
                 print(f"Name successfully changed to: {new_name}")
-                sound_manager.play_sound("menu_button")
+                self.sound_manager.play_menu_button()
                 self._change_state(GameState.OPTIONS_MENU)
             else:
                 print(f"Failed to change name to {new_name}. It might be taken.")
@@ -1069,60 +1194,58 @@ class GameController:
             self._change_state(GameState.OPTIONS_MENU)
 
     def _handle_playing_events(self, event):
-        if event.type == self.SCREEN_UPDATE:
-            self._update_game_logic()
-        elif event.type == pygame.KEYDOWN and self.snake:
-            if event.key == pygame.K_UP and self.snake.direction.y != 1: self.snake.direction = Vector2(0, -1)
-            elif event.key == pygame.K_DOWN and self.snake.direction.y != -1: self.snake.direction = Vector2(0, 1)
-            elif event.key == pygame.K_LEFT and self.snake.direction.x != 1: self.snake.direction = Vector2(-1, 0)
-            elif event.key == pygame.K_RIGHT and self.snake.direction.x != -1: self.snake.direction = Vector2(1, 0)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self._change_state(GameState.PAUSED)
+            return
+        if event.type == pygame.KEYDOWN and self.snake:
+            direction = KEY_DIRECTIONS.get(event.key)
+            if direction is None: return
+            # Any turn is allowed except straight back onto the body
+            current = self.snake.direction
+            if direction[0] + current[0] or direction[1] + current[1]:
+                self.snake.direction = direction
 
 
     def _update_game_logic(self):
         if not self.snake or not self.wall: return
 
-        self.snake.move()
-        
-        # Check Collisions
-        head = self.snake.body[0]
-        # Wall collision
-        if self.wall.check_collision(head):
-            self._trigger_game_over()
-            return
-        # Edge collision
-        if self.snake.check_bounds_collision():
-            self._trigger_game_over()
-            return
-        # Self collision
-        if self.snake.check_collision_with_self():
+        old_tail = self.snake.body[-1]
+        # Move and check wall, edge and self collisions in one pass
+        if self.snake.step(self.wall.occupancy) != MoveResult.OK:
             self._trigger_game_over()
             return
+        head = self.snake.body[0]
+        # The tail cell frees up unless the snake just grew; the head cell is taken
+        if self.snake.body[-1] != old_tail:
+            self._free_cells.add(old_tail)
+        self._free_cells.discard(head)
 
         # Apple collision
-        for apple_idx, apple in enumerate(self.apples):
-            if apple.is_active and head == apple.pos:
-                if apple.state == AppleState.POISONOUS:
-                    # Play vomit sound and shrink the snake
-                    sound_manager.play_sound("vomit")
-                    self.snake.shrink()
-                    self.score = max(0, self.score - 1)  
-                else:
-                    # Play crunch sound and grow the snake
-                    sound_manager.play_sound("crunch")
-                    self.snake.grow()
-                    self.score += 1
-                
-                self._handle_apple_despawn(apple, eaten=True)
-                break
+        apple = self._apple_by_pos.get(head)
+        if apple is not None:
+            if apple.state == AppleState.POISONOUS:
+                # Play vomit sound and shrink the snake
+                self.sound_manager.play_vomit()
+                tail = self.snake.body[-1]
+                if self.snake.shrink():
+                    self._free_cells.add(tail)
+                self.score = max(0, self.score - 1)  
+            else:
+                # Play crunch sound and grow the snake
+                self.sound_manager.play_crunch()
+                self.snake.grow()
+                self.score += 1
+            
+            self._handle_apple_despawn(apple, eaten=True)
                 
-        # Dynamic Wall Changes (if enabled by difficulty)
-        obstacle_speed_factor = self.current_difficulty_settings.get("obstacle_speed_factor", 1.0)
-        wall_change_interval = 10000 * obstacle_speed_factor # Base 10s, adjusted
-        if wall_change_interval < float('inf') and pygame.time.get_ticks() - self.last_wall_change_time > wall_change_interval:
+        # Dynamic Wall Changes (if enabled by difficulty; an infinite interval never fires)
+        now = self._frame_now
+        if now - self.last_wall_change_time > self._wall_change_interval_ms:
             num_obs = self.level_manager.get_num_obstacles()
-            apple_curr_pos = [a.pos for a in self.apples if a.is_active]
-            self.wall.generate(num_obs, self.snake.body, apple_curr_pos)
-            self.last_wall_change_time = pygame.time.get_ticks()
+            self.wall.generate(num_obs, self.snake.body, self._apple_by_pos.keys())
+            self._rebuild_free_cells()
+            self._scenery_surface = None
+            self.last_wall_change_time = now
 
         # Check for level completion
         if self.level_manager.is_level_complete(self.score):
@@ -1148,7 +1271,7 @@ class GameController:
 
             if player_data: 
                 self.volume = player_data.get("volume", DEFAULT_VOLUME)
-                sound_manager.set_volume(self.volume)
+                self.sound_manager.set_volume(self.volume)
                 
                 loaded_difficulty_from_db = player_data.get("difficulty") 
                 self.difficulty = loaded_difficulty_from_db if loaded_difficulty_from_db is not None else DEFAULT_DIFFICULTY
@@ -1164,70 +1287,51 @@ class GameController:
                 button._render_text()
             
             self._change_state(GameState.WELCOME)
-            sound_manager.play_sound("game_start")
+            self.sound_manager.play_game_start()
         else:
             print(f"Error adding/retrieving player ID for {player_name}. Name might be invalid or DB error.")
             self.name_input.set_text("Error. Try different name.")
 
     def _spawn_initial_apples(self):
-        self.apples.clear()
-        self.last_apple_spawn_time.clear()
-        num_apples_for_level = self.level_manager.get_num_apples()
-        for i in range(num_apples_for_level):
-            self._add_new_apple(slot_index=i)
-        
+        self.fruit_pool.release_all()
+        self._apple_by_pos.clear()
+        self._ensure_apple_count()
+
     def _ensure_apple_count(self):
         """Manages apple respawning to maintain the correct number for the level."""
         num_apples_for_level = self.level_manager.get_num_apples()
-        current_apple_count = sum(1 for apple in self.apples if apple.is_active)
-        
-        # Find empty slots or respawn inactive apples
-        for i in range(num_apples_for_level):
-            # Check if an apple for this slot exists and is active
-            slot_filled = False
-            for apple in self.apples:
-                pass 
-
-            if current_apple_count < num_apples_for_level:
-                 # Try to find an inactive apple to reactivate or add a new one if list is too short
-                found_inactive_to_reuse = False
-                for apple_in_list in self.apples:
-                    if not apple_in_list.is_active:
-                        self._reactivate_apple(apple_in_list)
-                        found_inactive_to_reuse = True
-                        current_apple_count +=1
-                        break
-                if not found_inactive_to_reuse and len(self.apples) < num_apples_for_level:
-                     self._add_new_apple(slot_index=len(self.apples)) # Add to a new conceptual slot
-                     current_apple_count +=1
-
-
-    def _add_new_apple(self, slot_index: int):
-        if not self.world_tileset: return
-        new_apple = Fruit(self.cell_size, self.cell_number, self.current_difficulty_settings)
-        
-        occupied_by_others = [a.pos for a in self.apples if a.is_active]
-        new_apple.randomize(self.snake.body if self.snake else [], self.wall.positions if self.wall else [], occupied_by_others)
-        
-        if new_apple.is_active:
-            self.apples.append(new_apple)
-            self.last_apple_spawn_time[id(new_apple)] = pygame.time.get_ticks() # Use apple id as key for timer
+        while self.fruit_pool.active_count() < num_apples_for_level:
+            if not self._spawn_apple():
+                break
+
+    def _spawn_apple(self) -> bool:
+        """Places a pooled apple on a free cell; returns False if no apple or cell was available."""
+        if not self.world_tileset: return False
+        apple = self.fruit_pool.acquire()
+        if apple is None:
+            return False
 
-    def _reactivate_apple(self, apple: Fruit):
-        occupied_by_others = [a.pos for a in self.apples if a.is_active and a is not apple]
-        apple.randomize(self.snake.body if self.snake else [], self.wall.positions if self.wall else [], occupied_by_others)
-        if apple.is_active:
-             self.last_apple_spawn_time[id(apple)] = pygame.time.get_ticks()
+        apple.randomize(self._free_cells)
+
+        if not apple.is_active:
+            self.fruit_pool.release(apple)
+            return False
+        self._free_cells.discard(apple.pos)
+        self._apple_by_pos[apple.pos] = apple
+        return True
 
 
     def _handle_apple_despawn(self, apple_to_remove: Fruit, eaten: bool = False):
-        # Mark as inactive instead of removing from list, to allow for fixed number of Fruit objects
-        apple_to_remove.is_active = False
-        apple_to_remove.pos = Vector2(-1,-1) # Move off screen
+        # An eaten apple's cell now holds the snake's head; otherwise it is free again
+        if apple_to_remove.is_active:
+            self._apple_by_pos.pop(apple_to_remove.pos, None)
+            if not eaten:
+                self._free_cells.add(apple_to_remove.pos)
+        # Hand the apple back to the pool instead of discarding it
+        self.fruit_pool.release(apple_to_remove)
 
-        # Logic to respawn an apple after a delay
-        pygame.time.set_timer(pygame.USEREVENT + 2 + self.apples.index(apple_to_remove), self.level_manager.get_apple_spawn_delay(), True)
-        self._ensure_apple_count()
+        # Respawn an apple after the level's spawn delay
+        heapq.heappush(self._apple_respawn_heap, self._frame_now + self.level_manager.get_apple_spawn_delay())
 
 
     def _trigger_game_over(self):
@@ -1242,34 +1346,39 @@ class GameController:
     def _trigger_game_completed(self):
         print("Game Completed (difficulty) triggered!")
         if self.player_id is not None:
-            self.player_db.update_player_score(
+            self.player_db.record_level_complete(
                 self.player_id, self.score, self.difficulty, self.level_manager.get_level_number() 
             )
         self._change_state(GameState.GAME_COMPLETED)
 
+    # Sounds for specific (old, new) transitions, checked before the plain new-state sounds
+    # Values are unbound SoundManager methods, called with self.sound_manager
+    _TRANSITION_SOUNDS = {
+        (GameState.NAME_INPUT, GameState.WELCOME): SoundManager.play_game_start, # Player just entered their name
+    }
+    _STATE_ENTRY_SOUNDS = {
+        GameState.GAME_OVER: SoundManager.play_game_over,
+        GameState.LEVEL_TRANSITION: SoundManager.play_level_finished, # Level completion
+        GameState.GAME_COMPLETED: SoundManager.play_level_finished,
+    }
+
     def _play_transition_sound(self, old_state, new_state):
         """Play appropriate sound for state transitions"""
-        if old_state == GameState.NAME_INPUT and new_state == GameState.WELCOME:
-            # Player just entered their name
-            sound_manager.play_sound("game_start")
-        elif new_state == GameState.GAME_OVER:
-            # Game Over state
-            sound_manager.play_sound("game_over")
-        elif new_state in [GameState.LEVEL_TRANSITION, GameState.GAME_COMPLETED]:
-            # Level completion
-            sound_manager.play_sound("level_finished")
+        play = self._TRANSITION_SOUNDS.get((old_state, new_state)) or self._STATE_ENTRY_SOUNDS.get(new_state)
+        if play:
+            play(self.sound_manager)
 
     def _handle_button_click(self, event, button):
         """Generic method to handle button clicks with sound"""
         if button.handle_event(event):
-            sound_manager.play_sound("menu_button")
+            self.sound_manager.play_menu_button()
             return True
         return False
 
     def _retry_game(self):
         """Restart the game after game over"""
         self._play_again()
-        sound_manager.play_sound("game_start")
+        self.sound_manager.play_game_start()
 
     def set_current_name(self, current_name):
         self.new_name_input.set_text(current_name)
@@ -1280,7 +1389,7 @@ class GameController:
             self._change_state(GameState.PAUSED)
         elif self.game_state == GameState.PAUSED:
             self._change_state(GameState.PLAYING)
-        sound_manager.play_sound("menu_button")
+        self.sound_manager.play_menu_button()
 
     def _go_to_level_select(self):
         """Method to go to level selection screen - store current difficulty first"""
@@ -1290,9 +1399,9 @@ class GameController:
 
     def _select_snake_color(self, color: str):
         """Set the snake color, update UI, and save to DB."""
-        if color in SNAKE_COLORS_AVAILABLE:
+        if color in VALID_SNAKE_COLORS:
             self.snake_color = color
-            sound_manager.play_sound("menu_button")
+            self.sound_manager.play_menu_button()
             print(f"Snake color changed to: {self.snake_color}")
 
             if self.player_id:
@@ -1,199 +1,215 @@
 import pygame
 import random
-from pygame.math import Vector2
-from typing import List, Tuple, Optional, Dict, Any
-from assets import load_sound, load_snake_sprites, load_apple_sprites, get_tileset, load_image
+from collections import deque
+from itertools import islice, product
+from typing import List, Tuple, Optional, Dict, Any, Set, Deque
+from assets import build_level_bg_surface, load_sound, load_snake_sprite_rects, load_scaled_apple_sprites, get_tileset, load_image, scale_surfaces
 from config import (DEFAULT_SNAKE_COLOR, POISON_APPLE_CHANCE,
                     LEVEL_BG_TILES, DEFAULT_BG_FILL_COLOR,
-                    APPLE_VISUAL_SCALE_FACTOR)
-
-# Enum for Apple State
-class AppleState:
-    GOOD = "good"
-    WARNING = "warning" # About to expire or turn poisonous
-    POISONOUS = "poisonous"
-    EXPIRED = "expired" # For internal handling if it just despawns
+                    APPLE_VISUAL_SCALE_FACTOR, DifficultyCfg,
+                    SnakePart, AppleState, MoveResult)
+
+
+# Middle segment part by (behind_x, behind_y, ahead_x, ahead_y): the offsets of its two neighbours
+BODY_PART_BY_NEIGHBOURS = {
+    (0, 1, 0, -1): SnakePart.BODY_VERTICAL, (0, -1, 0, 1): SnakePart.BODY_VERTICAL,
+    (1, 0, -1, 0): SnakePart.BODY_HORIZONTAL, (-1, 0, 1, 0): SnakePart.BODY_HORIZONTAL,
+    (1, 0, 0, -1): SnakePart.BODY_TL, (0, -1, 1, 0): SnakePart.BODY_TL,
+    (-1, 0, 0, -1): SnakePart.BODY_TR, (0, -1, -1, 0): SnakePart.BODY_TR,
+    (1, 0, 0, 1): SnakePart.BODY_BL, (0, 1, 1, 0): SnakePart.BODY_BL,
+    (-1, 0, 0, 1): SnakePart.BODY_BR, (0, 1, -1, 0): SnakePart.BODY_BR,
+    # Both neighbours on one side only happens on the frame the head turns back into the body
+    (1, 0, 1, 0): SnakePart.BODY_VERTICAL, (-1, 0, -1, 0): SnakePart.BODY_VERTICAL,
+    (0, 1, 0, 1): SnakePart.BODY_VERTICAL, (0, -1, 0, -1): SnakePart.BODY_VERTICAL,
+}
+
+# Head part by the head's offset from the next segment, tail part by the offset of the segment before it
+HEAD_PART_BY_OFFSET = {(1, 0): SnakePart.HEAD_RIGHT, (-1, 0): SnakePart.HEAD_LEFT,
+                       (0, 1): SnakePart.HEAD_DOWN, (0, -1): SnakePart.HEAD_UP}
+TAIL_PART_BY_OFFSET = {(1, 0): SnakePart.TAIL_LEFT, (-1, 0): SnakePart.TAIL_RIGHT,
+                       (0, 1): SnakePart.TAIL_UP, (0, -1): SnakePart.TAIL_DOWN}
 
 
 class Snake:
-    def __init__(self, cell_size: int, cell_number: int, initial_pos: Vector2 = Vector2(5,10), color: str = DEFAULT_SNAKE_COLOR):
+    def __init__(self, cell_size: int, cell_number: int, initial_pos: Tuple[int, int] = (5, 10), color: str = DEFAULT_SNAKE_COLOR):
         self.cell_size = cell_size
         self.cell_number = cell_number 
-        self.initial_pos = initial_pos
-        self.body: List[Vector2] = []
-        self.direction: Vector2 = Vector2(0, 0) # Start stationary
+        # Grid positions and directions are plain (x, y) int tuples
+        self.initial_pos = (int(initial_pos[0]), int(initial_pos[1]))
+        # Head first; a deque so moving adds and drops segments at the ends in O(1)
+        self.body: Deque[Tuple[int, int]] = deque()
+        # The same cells as a set, for O(1) self-collision checks
+        self._body_cells: Set[Tuple[int, int]] = set()
+        self.direction: Tuple[int, int] = (0, 0) # Start stationary
         self.new_block: bool = False
         self.color = color # Store the selected color
         
-        self.sprites = load_snake_sprites(self.cell_size, self.color) # Use stored color
-        self.head_sprite = self.sprites['head_right'] # Default
-        self.tail_sprite = self.sprites['tail_left']  # Default
+        self.atlas, self.sprite_rects = load_snake_sprite_rects(self.cell_size, self.color)
+        self.head_part = SnakePart.HEAD_RIGHT # Default
+        self.tail_part = SnakePart.TAIL_LEFT  # Default
+        # Cached draw() blits; None whenever the body has changed since it was built
+        self._blit_seq: Optional[List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]]] = None
 
         self.reset()
 
     def reset(self):
-        head_pos = self.initial_pos.copy()
-        body1_pos = Vector2(head_pos.x - 1, head_pos.y)
-        body2_pos = Vector2(head_pos.x - 2, head_pos.y)
-        self.body = [head_pos, body1_pos, body2_pos]
+        head_x, head_y = self.initial_pos
+        self.body = deque([(head_x, head_y), (head_x - 1, head_y), (head_x - 2, head_y)])
+        self._body_cells = set(self.body)
 
-        self.direction = Vector2(0, 0) # Start stationary, will be set by GameController
+        self.direction = (0, 0) # Start stationary, will be set by GameController
         self.new_block = False
         self.update_head_graphics()
         self.update_tail_graphics() 
+        self._blit_seq = None
 
     def draw(self, surface: pygame.Surface):
-        for i, segment in enumerate(self.body):
-            x_pos = int(segment.x * self.cell_size)
-            y_pos = int(segment.y * self.cell_size)
-            rect = pygame.Rect(x_pos, y_pos, self.cell_size, self.cell_size)
-
-            if 0 < i < len(self.body) - 1:
-                prev_block = self.body[i + 1] - self.body[i]
-                next_block = self.body[i - 1] - self.body[i]
-                
-                if prev_block.x == next_block.x: # Vertical line
-                    surface.blit(self.sprites['body_vertical'], rect)
-                elif prev_block.y == next_block.y: # Horizontal line
-                    surface.blit(self.sprites['body_horizontal'], rect)
-                else: # Corner
-                    # Determine which corner sprite to use
-                    if prev_block.x == 1 and next_block.y == -1 or prev_block.y == -1 and next_block.x == 1:
-                        # bottom-left corner
-                        surface.blit(self.sprites['body_tl'], rect)
-                    elif prev_block.x == -1 and next_block.y == -1 or prev_block.y == -1 and next_block.x == -1:
-                        # bottom-right corner
-                        surface.blit(self.sprites['body_tr'], rect)
-                    elif prev_block.x == 1 and next_block.y == 1 or prev_block.y == 1 and next_block.x == 1:
-                        # top-left corner
-                        surface.blit(self.sprites['body_bl'], rect)
-                    elif prev_block.x == -1 and next_block.y == 1 or prev_block.y == 1 and next_block.x == -1:
-                        # top-right corner
-                        surface.blit(self.sprites['body_br'], rect)
+        # The sequence only changes when the body does, so it is rebuilt after a move rather than every frame
+        if self._blit_seq is None:
+            self._blit_seq = self._build_blit_sequence()
+        # One batched call instead of a blit per segment; all parts share the atlas
+        surface.blits(self._blit_seq, doreturn=False)
+
+    def _build_blit_sequence(self) -> List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]]:
+        blit_sequence = []
+        atlas = self.atlas
+        sprite_rects = self.sprite_rects
+        cell_size = self.cell_size
+        # Walk the middle segments with their neighbours; indexing into the deque would be O(n) each
+        body = self.body
+        for (ahead_x, ahead_y), (seg_x, seg_y), (behind_x, behind_y) in zip(body, islice(body, 1, None), islice(body, 2, None)):
+            part = BODY_PART_BY_NEIGHBOURS.get((behind_x - seg_x, behind_y - seg_y, ahead_x - seg_x, ahead_y - seg_y))
+            if part is not None:
+                blit_sequence.append((atlas, (seg_x * cell_size, seg_y * cell_size), sprite_rects[part]))
 
         # Draw head
-        head_rect = pygame.Rect(
-            self.body[0].x * self.cell_size,
-            self.body[0].y * self.cell_size,
-            self.cell_size, self.cell_size
-        )
-        surface.blit(self.head_sprite, head_rect)
+        head_pos = (body[0][0] * cell_size, body[0][1] * cell_size)
+        blit_sequence.append((atlas, head_pos, sprite_rects[self.head_part]))
 
         # Draw tail 
-        if len(self.body) > 1:
-            tail_rect = pygame.Rect(
-                self.body[-1].x * self.cell_size,
-                self.body[-1].y * self.cell_size,
-                self.cell_size, self.cell_size
-            )
+        if len(body) > 1:
+            tail_pos = (body[-1][0] * cell_size, body[-1][1] * cell_size)
             self.update_tail_graphics()
-            surface.blit(self.tail_sprite, tail_rect)
+            blit_sequence.append((atlas, tail_pos, sprite_rects[self.tail_part]))
+        return blit_sequence
 
     def update_head_graphics(self):
-        # Update the head sprite based on current direction
+        # Update the head part based on current direction
         if len(self.body) == 1: return 
         
-        head_relation = self.body[0] - self.body[1]
-        
-        if head_relation == Vector2(1, 0): self.head_sprite = self.sprites['head_right']
-        elif head_relation == Vector2(-1, 0): self.head_sprite = self.sprites['head_left']
-        elif head_relation == Vector2(0, 1): self.head_sprite = self.sprites['head_down']
-        elif head_relation == Vector2(0, -1): self.head_sprite = self.sprites['head_up']
+        head_relation = (self.body[0][0] - self.body[1][0], self.body[0][1] - self.body[1][1])
+        self.head_part = HEAD_PART_BY_OFFSET.get(head_relation, self.head_part)
 
     def update_tail_graphics(self):
-        # Update the tail sprite based on position relative to the second-to-last segment
+        # Update the tail part based on position relative to the second-to-last segment
         if len(self.body) < 2: return
         
-        tail_relation = self.body[-2] - self.body[-1]
-        
-        if tail_relation == Vector2(1, 0): self.tail_sprite = self.sprites['tail_left']
-        elif tail_relation == Vector2(-1, 0): self.tail_sprite = self.sprites['tail_right']
-        elif tail_relation == Vector2(0, 1): self.tail_sprite = self.sprites['tail_up']
-        elif tail_relation == Vector2(0, -1): self.tail_sprite = self.sprites['tail_down']
+        tail_relation = (self.body[-2][0] - self.body[-1][0], self.body[-2][1] - self.body[-1][1])
+        self.tail_part = TAIL_PART_BY_OFFSET.get(tail_relation, self.tail_part)
 
     def move(self):
+        dir_x, dir_y = self.direction
         # If the snake isn't moving, don't do anything
-        if self.direction == Vector2(0, 0):
+        if not (dir_x or dir_y):
             return
 
-        # Copy the body segments except the last one (the tail)
-        body_segments = self.body[:-1] if not self.new_block else self.body[:]
-        
-        # Insert new head position at the beginning
-        new_head = self.body[0] + self.direction
-        body_segments.insert(0, new_head)
-        
-        # Update the body
-        self.body = body_segments
-        self.new_block = False
+        # Drop the tail unless growing, then push the new head on the front
+        head_x, head_y = self.body[0]
+        new_head = (head_x + dir_x, head_y + dir_y)
+        if self.new_block:
+            self.new_block = False
+        else:
+            self._body_cells.discard(self.body.pop())
+        self.body.appendleft(new_head)
+        self._body_cells.add(new_head)
         self.update_head_graphics()
+        self._blit_seq = None
+
+    def step(self, wall_occupancy: bytearray) -> MoveResult:
+        """Moves one cell and reports what the new head ran into.
+        wall_occupancy is Wall.occupancy, indexed x * cell_number + y.
+        Every check is constant time: two bounds compares, one byte lookup and a size compare."""
+        self.move()
+        head_x, head_y = self.body[0]
+        cell_number = self.cell_number
+        if not (0 <= head_x < cell_number and 0 <= head_y < cell_number):
+            return MoveResult.OUT_OF_BOUNDS
+        if wall_occupancy[head_x * cell_number + head_y]:
+            return MoveResult.HIT_WALL
+        # Inline of check_collision_with_self: the cell set is one short once the head lands on the body
+        if len(self._body_cells) != len(self.body):
+            return MoveResult.HIT_SELF
+        return MoveResult.OK
 
     def grow(self):
         self.new_block = True
 
     def shrink(self):
         if len(self.body) > 1:
-            self.body.pop()
+            self._body_cells.discard(self.body.pop())
+            self._blit_seq = None
             return True
         return False  
 
-    def change_direction(self, direction: Vector2):
+    def change_direction(self, direction: Tuple[int, int]):
+        direction = (int(direction[0]), int(direction[1]))
         if len(self.body) > 1:
-            if direction + self.direction != Vector2(0, 0):
+            if (direction[0] + self.direction[0], direction[1] + self.direction[1]) != (0, 0):
                 self.direction = direction
         else:
             self.direction = direction
 
     def check_bounds_collision(self) -> bool:
         """Check if the snake's head is outside the boundary"""
-        head = self.body[0]
+        head_x, head_y = self.body[0]
         return (
-            head.x < 0 or head.x >= self.cell_number or
-            head.y < 0 or head.y >= self.cell_number
+            head_x < 0 or head_x >= self.cell_number or
+            head_y < 0 or head_y >= self.cell_number
         )
 
     def check_collision_with_self(self) -> bool:
         """Check if the snake's head collides with its body"""
-        head = self.body[0]
-        return any(segment == head for segment in self.body[1:])
+        # Segments are distinct until the head moves onto one, which makes the set one short
+        return len(self._body_cells) != len(self.body)
 
-    def get_head_pos(self) -> Vector2:
+    def get_head_pos(self) -> Tuple[int, int]:
         return self.body[0] if self.body else self.initial_pos
 
 
 class Fruit:
-    def __init__(self, cell_size: int, cell_number: int, difficulty_settings: dict):
+    def __init__(self, cell_size: int, cell_number: int, difficulty_settings: DifficultyCfg):
         self.cell_size = cell_size
         self.cell_number = cell_number
-        self.pos: Vector2 = Vector2(-1, -1) # Initial off-screen position
+        self.pos: Tuple[int, int] = (-1, -1) # Initial off-screen position
         
-        self.apple_sprites = load_apple_sprites(cell_size)
-        self.image = self.apple_sprites[AppleState.GOOD] # Default
+        # Apples are drawn larger than a cell; scale each sprite once instead of every frame
+        target_size = int(cell_size * APPLE_VISUAL_SCALE_FACTOR)
+        self.scaled_sprites = load_scaled_apple_sprites(cell_size, (target_size, target_size))
+        self.scaled_image = self.scaled_sprites[AppleState.GOOD]
+        # Offset that centers the scaled image on its cell
+        self.draw_offset = cell_size / 2 - target_size / 2
+        # Top-left pixel of the scaled image, worked out whenever the apple moves
+        self.draw_pos = (0, 0)
         
         self.state = AppleState.GOOD
         self.spawn_time = 0
-        self.time_to_live = difficulty_settings.get("apple_total_life", float('inf'))
-        self.time_to_warn = difficulty_settings.get("apple_warning_time", float('inf'))
-        self.expiry_enabled = difficulty_settings.get("apple_expiry_enabled", False)
+        self.time_to_live = difficulty_settings.apple_total_life
+        self.time_to_warn = difficulty_settings.apple_warning_time
+        self.expiry_enabled = difficulty_settings.apple_expiry_enabled
         self.is_active = False # Becomes active once randomized
-        self.poison_time_to_live = difficulty_settings.get("poison_apple_life", 3000)  # Get from difficulty settings, default 3s
+        self.poison_time_to_live = difficulty_settings.poison_apple_life
+        # Tick time of the apple's next state change; callers skip update_state until then
+        self.next_update_time = float('inf')
 
     def draw(self, screen: pygame.Surface):
         if not self.is_active:
             return
-        
-        # Calculate the target size for drawing the apple
-        target_width = int(self.cell_size * APPLE_VISUAL_SCALE_FACTOR)
-        target_height = int(self.cell_size * APPLE_VISUAL_SCALE_FACTOR)
+        screen.blit(self.scaled_image, self.draw_pos)
 
-        # Scale the current apple image (self.image is already cell_size)
-        scaled_apple_image = pygame.transform.scale(self.image, (target_width, target_height))
-        
-        # Top-left for the new scaled image to be centered at the original cell's center
-        draw_x = (self.pos.x * self.cell_size + self.cell_size / 2) - target_width / 2
-        draw_y = (self.pos.y * self.cell_size + self.cell_size / 2) - target_height / 2
-        
-        screen.blit(scaled_apple_image, (int(draw_x), int(draw_y)))
+    def _update_draw_pos(self):
+        # Top-left for the scaled image to be centered at the original cell's center
+        self.draw_pos = (int(self.pos[0] * self.cell_size + self.draw_offset),
+                         int(self.pos[1] * self.cell_size + self.draw_offset))
 
     def update_state(self, current_time: pygame.time.Clock):
         if not self.is_active:
@@ -217,29 +233,40 @@ class Fruit:
             self.set_state(AppleState.POISONOUS)
             # Reset the timer for the poisonous duration
             self.spawn_time = current_time
+            self._schedule_next_update()
+
+    def _schedule_next_update(self):
+        """Works out when update_state next has something to do for the current state."""
+        if self.state == AppleState.POISONOUS:
+            self.next_update_time = self.spawn_time + self.poison_time_to_live
+        elif not self.expiry_enabled:
+            self.next_update_time = float('inf')
+        elif self.state == AppleState.GOOD:
+            self.next_update_time = self.spawn_time + self.time_to_live - self.time_to_warn
+        elif self.state == AppleState.WARNING:
+            self.next_update_time = self.spawn_time + self.time_to_live
+        else:
+            self.next_update_time = float('inf')
 
     def set_state(self, new_state: AppleState):
         self.state = new_state
-        self.image = self.apple_sprites.get(new_state, self.apple_sprites[AppleState.GOOD])
+        # EXPIRED has no sprite of its own; keep showing the good apple
+        sprite_index = new_state if new_state < len(self.scaled_sprites) else AppleState.GOOD
+        self.scaled_image = self.scaled_sprites[sprite_index]
         if new_state == AppleState.GOOD or new_state == AppleState.POISONOUS:
             # Reset timer when it becomes good or poisonous
             self.spawn_time = pygame.time.get_ticks() 
+        self._schedule_next_update()
 
-    def randomize(self, snake_body: List[Vector2], wall_positions: List[Vector2], other_apple_pos: List[Vector2]):
-        occupied_positions = snake_body + wall_positions + other_apple_pos
-        possible_positions = []
-        for r in range(self.cell_number):
-            for c in range(self.cell_number):
-                pos = Vector2(c,r)
-                if pos not in occupied_positions:
-                    possible_positions.append(pos)
-        
-        if not possible_positions:
+    def randomize(self, free_cells: "FreeCells"):
+        """Places the apple on a random cell from free_cells (the caller keeps it up to date)."""
+        if not free_cells:
             self.is_active = False # Cannot place apple
-            self.pos = Vector2(-1,-1)
+            self.pos = (-1, -1)
             return
 
-        self.pos = random.choice(possible_positions)
+        self.pos = free_cells.choice()
+        self._update_draw_pos()
         self.is_active = True
 
         # Determine if it should be poisonous (only if not already set by expiry)
@@ -248,11 +275,74 @@ class Fruit:
         else:
             self.set_state(AppleState.GOOD) 
 
+class FreeCells:
+    """Set of grid cells that also supports picking a random member in constant time.
+
+    Cells live in a list with a dict of their indexes; removal swaps the last cell into the gap.
+    """
+    def __init__(self, cells=()):
+        self._cells: List[Tuple[int, int]] = list(cells)
+        self._index: Dict[Tuple[int, int], int] = {cell: i for i, cell in enumerate(self._cells)}
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell in self._index
+
+    def add(self, cell: Tuple[int, int]):
+        if cell not in self._index:
+            self._index[cell] = len(self._cells)
+            self._cells.append(cell)
+
+    def discard(self, cell: Tuple[int, int]):
+        i = self._index.pop(cell, None)
+        if i is None:
+            return
+        last = self._cells.pop()
+        if i < len(self._cells):
+            self._cells[i] = last
+            self._index[last] = i
+
+    def choice(self) -> Tuple[int, int]:
+        return random.choice(self._cells)
+
+
+class FruitPool:
+    """A fixed set of Fruit objects built once per game and reused for every spawn."""
+    def __init__(self, cell_size: int, cell_number: int, difficulty_settings: DifficultyCfg, size: int):
+        self.fruits: Tuple[Fruit, ...] = tuple(Fruit(cell_size, cell_number, difficulty_settings) for _ in range(size))
+        self._available: Deque[Fruit] = deque(self.fruits)
+
+    def acquire(self) -> Optional[Fruit]:
+        """Hands out an unused fruit, or None when every slot is in play."""
+        return self._available.popleft() if self._available else None
+
+    def release(self, fruit: Fruit):
+        """Takes a fruit off the board and makes its slot available again."""
+        fruit.is_active = False
+        fruit.pos = (-1, -1) # Move off screen
+        fruit.next_update_time = float('inf')
+        self._available.append(fruit)
+
+    def release_all(self):
+        for fruit in self.fruits:
+            fruit.is_active = False
+            fruit.pos = (-1, -1)
+            fruit.next_update_time = float('inf')
+        self._available = deque(self.fruits)
+
+    def active_count(self) -> int:
+        return len(self.fruits) - len(self._available)
+
+
 class Wall:
     def __init__(self, cell_size: int, cell_number: int):
         self.cell_size = cell_size
         self.cell_number = cell_number
-        self.positions: List[Vector2] = []
+        self.positions: List[Tuple[int, int]] = []
+        # Flat occupancy grid (x * cell_number + y) so collision tests are a single index
+        self.occupancy = bytearray(cell_number * cell_number)
         
         self.snake_tileset = get_tileset("Snake.png", 16, 16, cell_size)
         
@@ -264,120 +354,114 @@ class Wall:
             (15, 8),   # Trees
         ]
         
-        # Load tiles and scale them up by 30%
+        # Load tiles and scale them up by 30% in one batched scale
         original_tiles = [self.snake_tileset.get_tile(x, y) for x, y in self.obstacle_tile_coords]
-        
-        # Scale the tiles up by 30%
-        self.tile_images = []
         scale_factor = 1.3  # 30% larger
-        for tile in original_tiles:
-            # Get original size
-            orig_width = tile.get_width()
-            orig_height = tile.get_height()
-            
-            # Calculate new size (30% larger)
-            new_width = int(orig_width * scale_factor)
-            new_height = int(orig_height * scale_factor)
-            
-            # Scale the tile
-            scaled_tile = pygame.transform.scale(tile, (new_width, new_height))
-            self.tile_images.append(scaled_tile)
+        new_width = int(original_tiles[0].get_width() * scale_factor)
+        new_height = int(original_tiles[0].get_height() * scale_factor)
+        self.tile_images = scale_surfaces(original_tiles, (new_width, new_height))
         
-        self.position_to_tile = {}
+        # (tile, pixel position) pairs for draw(), built once per generate()
+        self._blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
     
-    def _pos_to_key(self, pos: Vector2) -> str:
-        return f"{int(pos.x)},{int(pos.y)}"
+    def _pos_to_key(self, pos: Tuple[int, int]) -> int:
+        return pos[0] * self.cell_number + pos[1]
 
-    def generate(self, num_obstacles: int, snake_body: List[Vector2], fruit_positions: List[Vector2]):
+    def generate(self, num_obstacles: int, snake_body: List[Tuple[int, int]], fruit_positions: List[Tuple[int, int]]):
         self.positions.clear()
-        self.position_to_tile.clear()
+        self._blit_seq = []
+        self.occupancy = bytearray(self.cell_number * self.cell_number)
         if num_obstacles == 0:
             return
 
         forbidden_cols_initial_snake = 5
         snake_head_margin = 3
         
-        safe_zones_tuples = set()
-        for fp in fruit_positions:
-            safe_zones_tuples.add((int(fp.x), int(fp.y)))
+        safe_zones_tuples = set(fruit_positions)
 
         if snake_body:
-            head = snake_body[0]
+            head_x, head_y = snake_body[0]
             for dx in range(-snake_head_margin, snake_head_margin + 1):
                 for dy in range(-snake_head_margin, snake_head_margin + 1):
-                    safe_zones_tuples.add((int(head.x + dx), int(head.y + dy)))
-            for part in snake_body:
-                safe_zones_tuples.add((int(part.x), int(part.y)))
-
-        possible_positions = []
-        for r in range(self.cell_number):
-            for c in range(self.cell_number):
-                if c < forbidden_cols_initial_snake and snake_body and any(int(s.x) < forbidden_cols_initial_snake for s in snake_body):
-                    continue
-                current_pos_tuple = (c, r)
-                if current_pos_tuple not in safe_zones_tuples:
-                    possible_positions.append(Vector2(c, r))
-        
-        random.shuffle(possible_positions)
-
-        for _ in range(min(num_obstacles, len(possible_positions))):
-            position = possible_positions.pop()
+                    safe_zones_tuples.add((head_x + dx, head_y + dy))
+            safe_zones_tuples.update(snake_body)
+
+        # Keep the left columns clear while the snake is still in them
+        first_col = 0
+        if snake_body and any(s[0] < forbidden_cols_initial_snake for s in snake_body):
+            first_col = forbidden_cols_initial_snake
+
+        # Rejection-sample random cells; obstacles are sparse, so this rarely needs many draws
+        chosen = []
+        chosen_set = set()
+        for _ in range(num_obstacles * 4):
+            if len(chosen) == num_obstacles:
+                break
+            candidate = (random.randrange(first_col, self.cell_number), random.randrange(self.cell_number))
+            if candidate in safe_zones_tuples or candidate in chosen_set:
+                continue
+            chosen.append(candidate)
+            chosen_set.add(candidate)
+
+        if len(chosen) < num_obstacles:
+            # Crowded grid: fall back to sampling from every remaining free cell
+            blocked = safe_zones_tuples | chosen_set
+            possible_positions = [cell for cell in product(range(first_col, self.cell_number), range(self.cell_number))
+                                  if cell not in blocked]
+            # sample only draws the cells still needed instead of shuffling the whole list
+            chosen.extend(random.sample(possible_positions, min(num_obstacles - len(chosen), len(possible_positions))))
+
+        for position in chosen:
             self.positions.append(position)
-            # Assign a random tile index to this position using string key
-            self.position_to_tile[self._pos_to_key(position)] = random.randint(0, len(self.tile_images) - 1)
+            self.occupancy[self._pos_to_key(position)] = 1
+            # Assign a random tile index to this position
+            tile_index = random.randint(0, len(self.tile_images) - 1)
 
-    def draw(self, screen: pygame.Surface):
-        for pos in self.positions:
-            # Get the specific tile for this position using string key
-            tile_index = self.position_to_tile.get(self._pos_to_key(pos), 0)  # Default to first tile if not found
-            
-            # Get the tile image
-            tile = self.tile_images[tile_index]
-            
             # Calculate position considering the enlarged size
+            tile = self.tile_images[tile_index]
             tile_width, tile_height = tile.get_size()
-            x_pos = int(pos.x * self.cell_size + (self.cell_size - tile_width) / 2)
-            y_pos = int(pos.y * self.cell_size + (self.cell_size - tile_height) / 2)
-            
-            # Draw the tile at the adjusted position
-            screen.blit(tile, (x_pos, y_pos))
+            x_pos = int(position[0] * self.cell_size + (self.cell_size - tile_width) / 2)
+            y_pos = int(position[1] * self.cell_size + (self.cell_size - tile_height) / 2)
+            self._blit_seq.append((tile, (x_pos, y_pos)))
 
-    def check_collision(self, position: Vector2) -> bool:
-        return position in self.positions
+    def draw(self, screen: pygame.Surface):
+        # Tiles and their positions only change in generate(), so drawing is one batched call
+        screen.blits(self._blit_seq, doreturn=False)
+
+    def check_collision(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        if not (0 <= x < self.cell_number and 0 <= y < self.cell_number):
+            return False
+        return self.occupancy[x * self.cell_number + y] == 1
 
 # Background Manager
 class Background:
     def __init__(self, cell_size: int, cell_number: int, world_tileset_name="world_tileset.png"):
         self.cell_size = cell_size
         self.cell_number = cell_number
-        self.tileset = get_tileset(world_tileset_name, 16, 16, cell_size)
-        self.current_level_tiles = None
+        self.world_tileset_name = world_tileset_name
         self.fill_color = DEFAULT_BG_FILL_COLOR
+        # Whole background for the current level, rendered once in set_level_background
+        self.bg_surface = self._build_fill_surface()
 
     def set_level_background(self, level_number: int):
         level_bg_data = LEVEL_BG_TILES.get(level_number, LEVEL_BG_TILES.get(1)) 
         if level_bg_data:
-            primary_coord = level_bg_data["primary"]
-            secondary_coord = level_bg_data["secondary"]
-            self.current_level_tiles = {
-                "primary": self.tileset.get_tile(primary_coord[0], primary_coord[1]),
-                "secondary": self.tileset.get_tile(secondary_coord[0], secondary_coord[1]),
-            }
+            # build_level_bg_surface looks the tiles up itself and caches the result per level
             self.fill_color = level_bg_data.get("fill_color", DEFAULT_BG_FILL_COLOR)
+            self.bg_surface = build_level_bg_surface(level_number, self.cell_size, self.cell_number, self.world_tileset_name)
         else:
-            self.current_level_tiles = None 
             self.fill_color = DEFAULT_BG_FILL_COLOR
+            self.bg_surface = None
+        if self.bg_surface is None:
+            # No tiles for this level: bake the plain fill so draw() stays a single blit
+            self.bg_surface = self._build_fill_surface()
 
+    def _build_fill_surface(self) -> pygame.Surface:
+        size = self.cell_number * self.cell_size
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(self.fill_color)
+        return surface
 
     def draw(self, screen: pygame.Surface):
-        if self.current_level_tiles and self.current_level_tiles["primary"] and self.current_level_tiles["secondary"]:
-            tile1 = self.current_level_tiles["primary"]
-            tile2 = self.current_level_tiles["secondary"]
-            for row in range(self.cell_number):
-                for col in range(self.cell_number):
-                    bg_rect = pygame.Rect(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size)
-                    tile_image = tile1 if (row + col) % 2 == 0 else tile2
-                    screen.blit(tile_image, bg_rect)
-        else:
-            game_area_rect = pygame.Rect(0, 0, self.cell_number * self.cell_size, self.cell_number * self.cell_size) # Assuming game area starts at 0,0
-            pygame.draw.rect(screen, self.fill_color, game_area_rect)
\ No newline at end of file
+        screen.blit(self.bg_surface, (0, 0))
\ No newline at end of file
@@ -1,61 +1,90 @@
-from typing import Dict, List, Any
-from config import LEVEL_CONFIG, DEFAULT_DIFFICULTY
+from typing import Dict, Tuple, Any
+from config import LEVEL_CONFIG, DEFAULT_DIFFICULTY, DEFAULT_LEVEL_CFG, LevelCfg
 
 class LevelManager:
-    def __init__(self, levels_data: Dict[str, List[Dict]] = LEVEL_CONFIG):
+    def __init__(self, levels_data: Dict[str, Tuple[LevelCfg, ...]] = LEVEL_CONFIG):
         self.levels_data = levels_data
-        self.difficulty = DEFAULT_DIFFICULTY
-        self.current_level_index = 0
+        self._difficulty = DEFAULT_DIFFICULTY
+        self._current_level_index = 0
+        self._current_config = self._lookup_current_level_config()
+
+    # The current level's config is looked up once whenever the difficulty or level index
+    # changes, so the per-frame getters below are plain attribute reads
+    @property
+    def difficulty(self) -> str:
+        return self._difficulty
+
+    @difficulty.setter
+    def difficulty(self, difficulty: str):
+        self._difficulty = difficulty
+        self._current_config = self._lookup_current_level_config()
+
+    @property
+    def current_level_index(self) -> int:
+        return self._current_level_index
+
+    @current_level_index.setter
+    def current_level_index(self, index: int):
+        self._current_level_index = index
+        self._current_config = self._lookup_current_level_config()
 
     def set_difficulty(self, difficulty: str):
+        # Reset the index first so the config lookup never sees an old index with the new difficulty
+        self.current_level_index = 0
         if difficulty in self.levels_data:
             self.difficulty = difficulty
-            self.current_level_index = 0 
         else:
             print(f"Warning: Difficulty '{difficulty}' not found in LEVEL_CONFIG. Using default.")
             self.difficulty = DEFAULT_DIFFICULTY
-            self.current_level_index = 0
 
 
-    def get_current_level_config(self) -> Dict:
-        if self.difficulty not in self.levels_data:
+    def get_current_level_config(self) -> LevelCfg:
+        return self._current_config
+
+    def _lookup_current_level_config(self) -> LevelCfg:
+        if self._difficulty not in self.levels_data:
              # Fallback to default difficulty if current is somehow invalid
-            print(f"Error: Current difficulty '{self.difficulty}' not in levels_data. Falling back.")
-            self.difficulty = DEFAULT_DIFFICULTY 
+            print(f"Error: Current difficulty '{self._difficulty}' not in levels_data. Falling back.")
+            self._difficulty = DEFAULT_DIFFICULTY 
 
-        difficulty_levels = self.levels_data[self.difficulty]
+        difficulty_levels = self.levels_data[self._difficulty]
         if 0 <= self.current_level_index < len(difficulty_levels):
             return difficulty_levels[self.current_level_index]
         else:
             print(f"Warning: current_level_index {self.current_level_index} out of bounds for difficulty {self.difficulty}")
             # Return the last valid level config or a default
-            return difficulty_levels[-1] if difficulty_levels else {}
+            return difficulty_levels[-1] if difficulty_levels else DEFAULT_LEVEL_CFG
 
 
     def get_level_number(self) -> int:
-        return self.get_current_level_config().get("level", 1)
+        return self._current_config.level
 
     def get_target_score(self) -> int:
-        return self.get_current_level_config().get("target_score", 10)
+        return self._current_config.target_score
 
     def get_num_apples(self) -> int:
-        return self.get_current_level_config().get("num_apples", 1)
+        return self._current_config.num_apples
 
     def get_num_obstacles(self) -> int:
-        return self.get_current_level_config().get("num_obstacles", 0)
+        return self._current_config.num_obstacles
     
     def get_apple_spawn_delay(self) -> int:
-        return self.get_current_level_config().get("apple_spawn_delay", 500)
+        return self._current_config.apple_spawn_delay
+
+    def get_max_apples(self) -> int:
+        """Most apples any level asks for at once, across every difficulty."""
+        return max((cfg.num_apples for levels in self.levels_data.values() for cfg in levels),
+                   default=DEFAULT_LEVEL_CFG.num_apples)
 
-    def get_levels_for_difficulty(self, difficulty: str) -> List[Dict]:
+    def get_levels_for_difficulty(self, difficulty: str) -> Tuple[LevelCfg, ...]:
         """Returns the list of level configurations for a given difficulty."""
-        return self.levels_data.get(difficulty, [])
+        return self.levels_data.get(difficulty, ())
 
     def is_level_complete(self, score: int) -> bool:
-        return score >= self.get_target_score()
+        return score >= self._current_config.target_score
 
     def advance_level(self) -> bool:
-        difficulty_levels = self.levels_data.get(self.difficulty, [])
+        difficulty_levels = self.levels_data.get(self.difficulty, ())
         if self.current_level_index < len(difficulty_levels) - 1:
             self.current_level_index += 1
             return True
@@ -65,5 +94,5 @@ class LevelManager:
         self.current_level_index = 0
 
     def is_game_complete(self) -> bool:
-        difficulty_levels = self.levels_data.get(self.difficulty, [])
+        difficulty_levels = self.levels_data.get(self.difficulty, ())
         return self.current_level_index >= len(difficulty_levels) -1
\ No newline at end of file
@@ -6,10 +6,9 @@ import os
 if __name__ == "__main__":
     os.environ['SDL_VIDEO_CENTERED'] = '1'
 
-    pygame.mixer.pre_init(44100, -16, 2, 512) 
-    pygame.init()
+    # The mixer is initialized lazily by assets on the first sound or music request
+    pygame.display.init()
     pygame.font.init() 
-    pygame.mixer.init()
 
     os.makedirs(DATABASE_DIR, exist_ok=True)
 
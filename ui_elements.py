@@ -80,20 +80,43 @@ class Button:
         self.border_radius = border_radius
         self.is_hovered = False
         self.action = action
+        self._faces = {}
         self._render_text()
 
     def _render_text(self):
         self.text_surf = self.font.render(self.text, True, self.text_color)
         self.text_rect = self.text_surf.get_rect(center=self.rect.center)
+        self._faces.clear()
 
-    def draw(self, screen: pygame.Surface):
+    def _build_face(self, fill_color) -> pygame.Surface:
+        """Renders the filled, outlined and labelled button onto one transparent surface."""
+        area = self.rect.union(self.text_rect)
+        face = pygame.Surface(area.size, pygame.SRCALPHA)
+        local_rect = self.rect.move(-area.x, -area.y)
+        pygame.draw.rect(face, fill_color, local_rect, border_radius=self.border_radius)
+        pygame.draw.rect(face, self.text_color, local_rect, 3, border_radius=self.border_radius)
+        face.blit(self.text_surf, self.text_rect.move(-area.x, -area.y))
+        return face
+
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """(surface, dest) for the button's current look, for batching with blits/fblits."""
         current_color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, current_color, self.rect, border_radius=self.border_radius)
-        pygame.draw.rect(screen, self.text_color, self.rect, 3, border_radius=self.border_radius)
-        screen.blit(self.text_surf, self.text_rect)
+        # Colors may be reassigned directly by callers, so they are part of the key
+        key = (tuple(current_color), tuple(self.text_color), self.text_surf, tuple(self.rect))
+        face = self._faces.get(key)
+        if face is None:
+            face = self._faces[key] = self._build_face(current_color)
+        area = self.rect.union(self.text_rect)
+        return face, area.topleft
 
-    def check_hover(self, mouse_pos: Tuple[int, int]):
+    def draw(self, screen: pygame.Surface):
+        screen.blit(*self.blit_item())
+
+    def check_hover(self, mouse_pos: Tuple[int, int]) -> bool:
+        """Updates the hover state. Returns True if it changed, i.e. the button needs repainting."""
+        was_hovered = self.is_hovered
         self.is_hovered = self.rect.collidepoint(mouse_pos)
+        return self.is_hovered != was_hovered
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Checks if the button was clicked and executes its action. Returns True if action performed."""